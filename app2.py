@@ -1,6 +1,8 @@
 import streamlit as st
-import importlib
-import os
+
+from common import dashboard_loader
+from common.sheet_loader import prefetch
+from models.registry import DASHBOARDS, MODEL_NAMES, model_dashboards, model_sheets, sheet
 
 st.set_page_config(page_title="NPI Dashboard", layout="wide", initial_sidebar_state="expanded")
 
@@ -51,10 +53,10 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Get models
-model_folders = [f for f in os.listdir("models") if os.path.isdir(os.path.join("models", f))]
+model_folders = MODEL_NAMES
 
 if not model_folders:
-    st.error("No models found in 'models/' folder.")
+    st.error("No models found in models/registry.py.")
     st.stop()
 
 # === SIDEBAR: Only Model Selection ===
@@ -156,23 +158,38 @@ if "selected_dashboard" not in st.session_state:
 
 selected_dashboard = st.session_state.selected_dashboard
 
+# Fetch all of the model's sheets at once so switching dashboards is instant
+if selected_dashboard in DASHBOARDS:
+    prefetch(model_sheets(selected_model))
+
+# Dashboard modules are imported on first use (timed, see common/dashboard_loader.py)
+module_name = None
 try:
     # ✅ COMMON DASHBOARD (NO MODEL)
     if selected_dashboard == "issues_tracker":
-        module = importlib.import_module("common.issues_tracker")
+        module_name = "common.issues_tracker"
+        module = dashboard_loader.load(module_name)
+        dashboard_loader.render(module_name, module.main)
 
-    # ✅ MODEL-SPECIFIC DASHBOARDS
-    else:
-        module = importlib.import_module(
-            f"models.{selected_model}.{selected_dashboard}"
-        )
+    # ✅ MODEL DASHBOARDS: one engine per dashboard type, fed the model's sheet
+    elif selected_dashboard in model_dashboards(selected_model):
+        module_name = f"dashboards.{selected_dashboard}"
+        module = dashboard_loader.load(module_name)
+        dashboard_loader.render(module_name, module.main, sheet(selected_model, selected_dashboard))
 
-    module.main()
+    else:
+        st.info(f"{selected_model.replace('_', ' ').upper()} has no {selected_dashboard.upper()} dashboard yet.")
 
 except Exception as e:
     st.error(f"Error loading {selected_dashboard.upper()} dashboard")
     st.exception(e)
 
+# Cold-start cost of the dashboard on screen: its import and first render in this process
+timing = dashboard_loader.timings(module_name) if module_name else {}
+if timing:
+    with st.sidebar:
+        st.caption(" • ".join(f"{step.replace('_', ' ')} {seconds * 1000:.0f} ms" for step, seconds in timing.items()))
+
 
 
 # Footer
@@ -0,0 +1,48 @@
+"""Lazy, timed loading of dashboard modules.
+
+app.py runs top to bottom on every click, so it imports nothing
+dashboard-specific up front: a dashboard module is imported the first
+time someone opens it. That import and the module's first render are
+timed once per process, so cold starts and first clicks stay measurable.
+"""
+import importlib
+import sys
+import threading
+import time
+
+_timings = {}   # module name -> {"import": seconds, "first_render": seconds}
+_lock = threading.Lock()
+
+
+def load(name):
+    """Import module ``name`` on first use; afterwards a dictionary lookup."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    with _lock:
+        _timings.setdefault(name, {}).setdefault("import", elapsed)
+    return module
+
+
+def render(name, fn, *args):
+    """Call ``fn(*args)``, timing the first call for module ``name``."""
+    with _lock:
+        first = "first_render" not in _timings.get(name, {})
+    if not first:
+        return fn(*args)
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            _timings.setdefault(name, {}).setdefault("first_render", elapsed)
+
+
+def timings(name):
+    """``{"import": s, "first_render": s}`` recorded so far for ``name``."""
+    with _lock:
+        return dict(_timings.get(name, {}))
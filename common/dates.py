@@ -0,0 +1,89 @@
+"""Date parsing shared by the dashboards.
+
+Sheets hold dates as typed text: "12-Jan", "12-Jan-26", "1/12/2026"...
+``parse_dates`` turns such a column into datetime64 in one pass: the
+column's format is inferred once (and, given a ``key`` such as ``(sheet
+name, column)``, remembered so the next data version only has to confirm
+it), only the distinct strings are parsed, and the results are mapped
+back onto the rows by position. Keys must name the sheet: two sheets'
+"Target Date" columns can use opposite day/month orders.
+
+Day-month dates without a year ("12-Jan") are taken to be in the current
+year, the same way on every dashboard. Blanks, "—" and text in no known
+format become NaT.
+"""
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+FORMATS = [
+    "%d-%b", "%d-%b-%y", "%d-%b-%Y", "%d %b", "%d %b %Y",
+    "%m/%d/%Y", "%d/%m/%Y", "%m/%d/%y", "%d/%m/%y",
+    "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d-%m-%Y", "%d.%m.%Y",
+]
+YEARLESS = {"%d-%b", "%d %b"}
+BLANKS = ["—", "", "NaT", "NA", "nan", "None"]
+
+_SAMPLE = 200    # distinct values tried against every format when inferring
+_inferred = {}   # (sheet, column) key -> format that parsed it last time
+_lock = threading.Lock()
+
+
+def _parse_with(strings, fmt, year):
+    if fmt in YEARLESS:
+        # Give the year explicitly, so 29-Feb parses in leap years
+        strings, fmt = strings + f"|{year}", fmt + "|%Y"
+    return pd.to_datetime(strings, format=fmt, errors="coerce")
+
+
+def _candidates(uniques, key, dayfirst, year):
+    """Formats to try, best first: the remembered one if it still fits."""
+    with _lock:
+        known = _inferred.get(key)
+    if known and _parse_with(uniques, known, year).notna().all():
+        return [known]
+
+    formats = FORMATS
+    if dayfirst:
+        formats = sorted(FORMATS, key=lambda f: not f.startswith("%d"))
+    sample = uniques[:_SAMPLE]
+    hits = {fmt: int(_parse_with(sample, fmt, year).notna().sum()) for fmt in formats}
+    ranked = sorted(formats, key=lambda f: -hits[f])
+    if hits[ranked[0]] and key is not None:
+        with _lock:
+            _inferred[key] = ranked[0]
+    # The rest stay in the list for stragglers outside the sample
+    return ranked
+
+
+def parse_dates(values, fmt=None, key=None, dayfirst=False, year=None):
+    """Parse a column of date text into a datetime64 Series.
+
+    ``fmt`` pins the format; otherwise it is inferred (``dayfirst`` breaks
+    d/m vs m/d ties) and cached under ``key`` (not cached without one).
+    Mixed columns are handled: values the main format rejects are tried
+    against the runners-up.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if year is None:
+        year = date.today().year
+
+    text = values.astype(str).str.strip()
+    codes, uniques = pd.factorize(text.mask(text.isin(BLANKS)))
+    uniques = pd.Index(uniques, dtype=object)
+
+    # Last slot stays NaT and catches code -1 (blank)
+    parsed = np.full(len(uniques) + 1, np.datetime64("NaT"), dtype="datetime64[ns]")
+    todo = np.arange(len(uniques))
+    for f in ([fmt] if fmt else _candidates(uniques, key, dayfirst, year)):
+        if not len(todo):
+            break
+        got = _parse_with(uniques[todo], f, year)
+        ok = np.asarray(got.notna())
+        parsed[todo[ok]] = got[ok].to_numpy(dtype="datetime64[ns]")
+        todo = todo[~ok]
+
+    return pd.Series(parsed[codes], index=values.index, name=values.name)
@@ -0,0 +1,33 @@
+"""Precomputed row indexes for dashboard filters.
+
+``build_index`` maps every value of the filterable columns to the
+positions of its rows; it runs in a dashboard's ``prepare()``, so once
+per data version. ``select_rows`` then answers a filter combination by
+intersecting those position arrays instead of re-scanning the frame
+with boolean masks on every click.
+"""
+import numpy as np
+
+ALL = "All"
+
+
+def build_index(df, columns):
+    """``{column: {value: sorted row positions}}``; blank (NaN) cells are not indexed."""
+    return {col: df.groupby(col, sort=False).indices for col in columns}
+
+
+def select_rows(df, index, choices):
+    """Rows of ``df`` matching every ``{column: value}`` in ``choices``.
+
+    A value of ``"All"`` (or None) leaves that column unfiltered. Rows
+    keep their original order.
+    """
+    positions = None
+    for col, value in choices.items():
+        if value is None or value == ALL:
+            continue
+        rows = index[col].get(value, np.empty(0, dtype=np.intp))
+        positions = rows if positions is None else np.intersect1d(positions, rows, assume_unique=True)
+    if positions is None:
+        return df
+    return df.take(positions)
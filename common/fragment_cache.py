@@ -0,0 +1,47 @@
+"""Process-wide cache of rendered dashboard fragments (table HTML).
+
+A dashboard's table is a pure function of the sheet's data version, the
+dashboard and the user's filter/page selection, so the markup is kept
+under that key and shared by every session and rerun: an identical view
+costs a dictionary lookup instead of a render. Entries also carry the
+date, because statuses like Delayed/Overdue roll over at midnight.
+
+The cache is an LRU bounded both by entry count and by total size.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+
+MAX_ENTRIES = 256
+MAX_BYTES = 64 * 1024 * 1024
+
+_fragments = OrderedDict()   # (day, *key) -> html
+_size = 0
+_lock = threading.Lock()
+
+
+def cached_fragment(key, render):
+    """Return ``render()`` for ``key`` (a hashable tuple), rendering only on a miss.
+
+    ``key`` must capture everything the markup depends on besides the
+    date: typically ``(SHEET_NAME, version, *filters, *page)``, with the
+    version ``load_prepared`` returned alongside the data.
+    """
+    global _size
+    key = (date.today(),) + tuple(key)
+    with _lock:
+        html = _fragments.get(key)
+        if html is not None:
+            _fragments.move_to_end(key)
+            return html
+
+    html = render()
+    with _lock:
+        if key not in _fragments:
+            _fragments[key] = html
+            _size += len(html)
+        while _fragments and (len(_fragments) > MAX_ENTRIES or _size > MAX_BYTES):
+            _, old = _fragments.popitem(last=False)
+            _size -= len(old)
+    return html
+
@@ -0,0 +1,63 @@
+"""HTML table bodies for the dashboards, built a column at a time.
+
+Instead of growing one string cell by cell inside ``iterrows()``, a
+table is assembled from whole columns: ``cells`` escapes a column and
+wraps every value in its ``<td>`` in a few vectorized string operations,
+and ``rows`` stitches the columns into ``<tr>`` rows with a single join.
+Both are linear in the number of cells.
+
+Cell text is HTML-escaped, so a stray ``<`` in a sheet can no longer
+break the page layout.
+"""
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+
+def _text(values):
+    # Positional, and every value (NaN included) rendered the way str() would
+    return pd.Series(np.asarray(values, dtype=object).astype(str))
+
+
+def column(df, col, default="—"):
+    """``df[col]``, or ``default`` on every row when the column is missing."""
+    if col is not None and col in df.columns:
+        return df[col]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def escape(values, newlines=False):
+    """HTML-escape a whole column; ``newlines`` turns line breaks into ``<br>``."""
+    text = _text(values)
+    text = text.str.replace("&", "&amp;", regex=False)
+    text = text.str.replace("<", "&lt;", regex=False).str.replace(">", "&gt;", regex=False)
+    if newlines:
+        text = text.str.replace("\n", "<br>", regex=False)
+    return text
+
+
+def cells(values, style, newlines=False):
+    """``<td>`` markup for every value of a column.
+
+    ``style`` is the inline CSS: one string for the whole column, or one
+    per row (a Series/array in row order).
+    """
+    text = escape(values, newlines)
+    if isinstance(style, str):
+        return (f"<td style='{style}'>" + text + "</td>").tolist()
+    return ("<td style='" + _text(style) + "'>" + text + "</td>").tolist()
+
+
+def rows(columns, row_style=None):
+    """Join per-column ``cells`` into the ``<tr>`` rows of a ``<tbody>``.
+
+    ``row_style`` is None for bare ``<tr>`` tags, else one CSS string per row.
+    """
+    if not columns:
+        return ""
+    if row_style is None:
+        opens = repeat("<tr>", len(columns[0]))
+    else:
+        opens = ("<tr style='" + _text(row_style) + "'>").tolist()
+    return "".join(map("".join, zip(opens, *columns, repeat("</tr>"))))
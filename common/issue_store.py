@@ -0,0 +1,490 @@
+"""Local SQLite copy of the Daily Issues Tracker, with an outbox.
+
+The store is the tracker's primary copy: the dashboard reads it and
+saves commit to it in one short transaction. Every change also lands in
+the ``outbox`` table in the same transaction, in order. A background
+worker (see ``common.issues_tracker``) pushes the outbox to the
+worksheet and acknowledges entries as they succeed. An entry the
+worksheet keeps rejecting is moved aside to ``dead_letters`` so the
+rest of the queue, and pulls, carry on.
+
+Rows keep a stable ``id``, so concurrent editors only touch the cells
+they changed; a pull matches rows to the worksheet's by content, so ids
+survive rows being inserted or deleted in the worksheet. A row's
+worksheet position is derived from ``pos`` over the rows the worksheet
+currently holds (``in_sheet``). A deleted row stays as a tombstone until
+its delete has been pushed, so positions match the worksheet as of the
+last acknowledged change; the worker checks a row before writing to it,
+as the worksheet may have moved on since.
+
+Closed issues past their retention move to the ``archive`` table (and,
+through the outbox, to the archive worksheet), so the editable hot set
+stays small while the history remains browsable page by page.
+
+The file lives next to the dashboard snapshots, so every process on the
+host shares it (``NPI_ISSUE_DB`` overrides the path).
+"""
+import difflib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from common.snapshot_store import SNAPSHOT_DIR
+
+DB_PATH = os.environ.get("NPI_ISSUE_DB", os.path.join(SNAPSHOT_DIR, "issues.sqlite3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    pos      INTEGER NOT NULL,             -- order in the worksheet
+    in_sheet INTEGER NOT NULL,             -- the worksheet has this row
+    deleted  INTEGER NOT NULL DEFAULT 0,   -- tombstone until the delete is pushed
+    data     TEXT NOT NULL                 -- JSON {column: cell text}
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    seq      INTEGER PRIMARY KEY AUTOINCREMENT,
+    op       TEXT NOT NULL,                -- update | append | delete
+    issue_id INTEGER NOT NULL,
+    cells    TEXT NOT NULL,                -- JSON {column: cell text}
+    attempts INTEGER NOT NULL DEFAULT 0,
+    rejected INTEGER NOT NULL DEFAULT 0,   -- failures retrying will not fix
+    error    TEXT
+);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    seq      INTEGER PRIMARY KEY,          -- outbox seq it was queued under
+    op       TEXT NOT NULL,
+    issue_id INTEGER NOT NULL,
+    cells    TEXT NOT NULL,
+    error    TEXT,
+    set_at   REAL NOT NULL                 -- epoch seconds
+);
+CREATE TABLE IF NOT EXISTS archive (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue_id INTEGER,                      -- hot row it was moved from
+    in_sheet INTEGER NOT NULL,             -- the archive worksheet has this row
+    data     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_local = threading.local()
+
+
+def _connection():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _transaction():
+    conn = _connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def header():
+    """Worksheet column order as of the last pull, or None before the first one."""
+    return _meta(_connection(), "header")
+
+
+def _meta(conn, key):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def _set_meta(conn, key, value):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+
+def _path(column):
+    # JSON path of a column inside ``data``
+    return "$." + json.dumps(column)
+
+
+def load(equal=None, between=None):
+    """Live rows as a text frame indexed by issue id, in worksheet order.
+
+    ``equal`` (``{column: text}``) and ``between`` (``{column: (first,
+    last)}``, ISO dates, inclusive) narrow the rows down in SQL, so only
+    the selected partition is read and parsed.
+    """
+    columns = header() or []
+    clauses, params = ["deleted = 0"], []
+    for col, value in (equal or {}).items():
+        clauses.append("json_extract(data, ?) = ?")
+        params += [_path(col), value]
+    for col, (first, last) in (between or {}).items():
+        clauses.append("json_extract(data, ?) BETWEEN ? AND ?")
+        params += [_path(col), first, last]
+    rows = _connection().execute(
+        f"SELECT id, data FROM issues WHERE {' AND '.join(clauses)} ORDER BY pos", params
+    ).fetchall()
+    df = pd.DataFrame(
+        [json.loads(data) for _, data in rows], columns=columns, index=pd.Index([i for i, _ in rows], name="id"),
+    )
+    return df.fillna("")
+
+
+def distinct(column):
+    """Sorted non-blank values of ``column`` among live rows, for filter options."""
+    rows = _connection().execute(
+        "SELECT DISTINCT json_extract(data, ?) FROM issues WHERE deleted = 0", (_path(column),)
+    ).fetchall()
+    return sorted(str(value) for value, in rows if value not in (None, ""))
+
+
+def apply(updates, deletes, appends):
+    """Commit one save: ``{id: {column: text}}``, ``[id]``, ``[{column: text}]``.
+
+    Each change is queued in the outbox in the same transaction. Changes
+    to rows deleted meanwhile (by another editor) are dropped. Returns the
+    number of rows updated/deleted/added.
+    """
+    done = {"updated": 0, "deleted": 0, "added": 0}
+    with _transaction() as conn:
+        for issue_id, cells in updates.items():
+            row = conn.execute("SELECT data FROM issues WHERE id = ? AND deleted = 0", (issue_id,)).fetchone()
+            if row is None:
+                continue
+            conn.execute("UPDATE issues SET data = ? WHERE id = ?", (json.dumps({**json.loads(row[0]), **cells}), issue_id))
+            conn.execute("INSERT INTO outbox (op, issue_id, cells) VALUES ('update', ?, ?)", (issue_id, json.dumps(cells)))
+            done["updated"] += 1
+
+        for issue_id in deletes:
+            row = conn.execute("SELECT data FROM issues WHERE id = ? AND deleted = 0", (issue_id,)).fetchone()
+            if row is None:
+                continue
+            # Queued with the row's contents: the push checks the worksheet row
+            # still holds them before deleting it. Rows still waiting to be
+            # appended go the same way, as their append may already be in flight
+            conn.execute("UPDATE issues SET deleted = 1 WHERE id = ?", (issue_id,))
+            conn.execute("INSERT INTO outbox (op, issue_id, cells) VALUES ('delete', ?, ?)", (issue_id, row[0]))
+            done["deleted"] += 1
+
+        pos = conn.execute("SELECT COALESCE(MAX(pos), 0) FROM issues").fetchone()[0]
+        for cells in appends:
+            pos += 1
+            cur = conn.execute("INSERT INTO issues (pos, in_sheet, data) VALUES (?, 0, ?)", (pos, json.dumps(cells)))
+            conn.execute("INSERT INTO outbox (op, issue_id, cells) VALUES ('append', ?, ?)", (cur.lastrowid, json.dumps(cells)))
+            done["added"] += 1
+    return done
+
+
+def pending(limit=500):
+    """The oldest queued changes, ``[(seq, op, issue_id, cells, attempts)]`` in commit order."""
+    rows = _connection().execute(
+        "SELECT seq, op, issue_id, cells, attempts FROM outbox ORDER BY seq LIMIT ?", (limit,)
+    ).fetchall()
+    return [(seq, op, issue_id, json.loads(cells), attempts) for seq, op, issue_id, cells, attempts in rows]
+
+
+def status():
+    """Sync state for the dashboard.
+
+    ``pending`` queued changes and the ``error`` of the oldest one, when
+    the last pull succeeded (``pulled_at``, epoch seconds) and why the
+    latest one failed (``pull_error``, None once a pull succeeds), when
+    the archive was last mirrored (``archive_pulled_at``) and why the
+    latest archive pull failed (``archive_pull_error``), and how many
+    changes were set aside (``dead``) with the latest one's ``dead_error``.
+    """
+    conn = _connection()
+    pending, = conn.execute("SELECT COUNT(*) FROM outbox").fetchone()
+    row = conn.execute("SELECT error FROM outbox ORDER BY seq LIMIT 1").fetchone()
+    dead, = conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()
+    dead_error = conn.execute("SELECT error FROM dead_letters ORDER BY set_at DESC LIMIT 1").fetchone()
+    return {
+        "pending": pending,
+        "error": row[0] if row else None,
+        "pulled_at": _meta(conn, "pulled_at") or 0,
+        "pull_error": _meta(conn, "pull_error"),
+        "archive_pulled_at": _meta(conn, "archive_pulled_at") or 0,
+        "archive_pull_error": _meta(conn, "archive_pull_error"),
+        "dead": dead,
+        "dead_error": dead_error[0] if dead_error else None,
+    }
+
+
+def sheet_size():
+    """Data rows the worksheet holds as far as the store knows."""
+    return _connection().execute("SELECT COUNT(*) FROM issues WHERE in_sheet = 1").fetchone()[0]
+
+
+def sheet_rows(ids):
+    """``{id: worksheet row number}`` (row 1 is the header) for rows the worksheet holds."""
+    rows = _connection().execute(
+        "SELECT id, ROW_NUMBER() OVER (ORDER BY pos) + 1 FROM issues WHERE in_sheet = 1"
+    ).fetchall()
+    wanted = set(ids)
+    return {issue_id: row for issue_id, row in rows if issue_id in wanted}
+
+
+def sheet_cells(ids):
+    """``{id: {column: text}}`` the worksheet rows should still hold.
+
+    That is the stored cells minus those with updates still queued,
+    which the worksheet may or may not have yet.
+    """
+    conn = _connection()
+    found = {}
+    for issue_id in set(ids):
+        row = conn.execute("SELECT data FROM issues WHERE id = ?", (issue_id,)).fetchone()
+        if row is None:
+            continue
+        cells = json.loads(row[0])
+        for queued, in conn.execute("SELECT cells FROM outbox WHERE issue_id = ? AND op = 'update'", (issue_id,)):
+            for col in json.loads(queued):
+                cells.pop(col, None)
+        found[issue_id] = cells
+    return found
+
+
+def acknowledge(seqs, appended=(), deleted=(), restored=()):
+    """Retire outbox entries ``seqs``.
+
+    ``appended`` rows are now in the worksheet and ``deleted`` ones gone
+    from it, along with any archive copy that never reached the archive
+    worksheet; ``restored`` rows had their delete or archiving dropped
+    and are live again.
+    """
+    with _transaction() as conn:
+        conn.executemany("DELETE FROM outbox WHERE seq = ?", [(s,) for s in seqs])
+        conn.executemany("UPDATE issues SET in_sheet = 1 WHERE id = ?", [(i,) for i in appended])
+        conn.executemany("DELETE FROM issues WHERE id = ?", [(i,) for i in deleted])
+        conn.executemany("DELETE FROM archive WHERE issue_id = ? AND in_sheet = 0", [(i,) for i in deleted])
+        conn.executemany("UPDATE issues SET deleted = 0 WHERE id = ?", [(i,) for i in restored])
+        conn.executemany("DELETE FROM archive WHERE issue_id = ? AND in_sheet = 0", [(i,) for i in restored])
+
+
+def fail(seq, error, rejected=False):
+    """Record a failed push of entry ``seq``; ``rejected``: retrying will not help."""
+    with _transaction() as conn:
+        conn.execute(
+            "UPDATE outbox SET attempts = attempts + 1, rejected = rejected + ?, error = ? WHERE seq = ?",
+            (int(rejected), str(error) or type(error).__name__, seq),
+        )
+
+
+def set_aside(max_rejected):
+    """Move entries rejected ``max_rejected`` times to ``dead_letters``.
+
+    Their rows go back to what the store held before: deleted or archived
+    rows are live again and never-sent archive copies are dropped, so the
+    next pull reconciles the store with the worksheet. A row whose append
+    is set aside never reaches the worksheet: it is dropped, and the
+    changes queued after it go aside with it. Returns how many entries
+    were moved.
+    """
+    with _transaction() as conn:
+        rows = conn.execute(
+            "SELECT seq, op, issue_id, cells, error FROM outbox WHERE rejected >= ?", (max_rejected,)
+        ).fetchall()
+        return _set_aside(conn, rows)
+
+
+def reject(seqs, error):
+    """Set entries ``seqs`` aside at once: retrying cannot place them (``error``)."""
+    with _transaction() as conn:
+        rows = [
+            conn.execute("SELECT seq, op, issue_id, cells, ? FROM outbox WHERE seq = ?", (error, seq)).fetchone()
+            for seq in seqs
+        ]
+        return _set_aside(conn, [row for row in rows if row])
+
+
+def _set_aside(conn, rows):
+    # Outbox ``rows`` (seq, op, issue_id, cells, error) -> dead_letters; see set_aside
+    unsent = [issue_id for _, op, issue_id, _, _ in rows if op == "append"]
+    for issue_id in unsent:
+        rows += conn.execute(
+            "SELECT seq, op, issue_id, cells, ? FROM outbox WHERE issue_id = ?",
+            ("its row was never added to the worksheet", issue_id),
+        ).fetchall()
+    rows = list({row[0]: row for row in reversed(rows)}.values())   # an entry's first reason wins
+    now = time.time()
+    conn.executemany(
+        "INSERT OR REPLACE INTO dead_letters (seq, op, issue_id, cells, error, set_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(*row, now) for row in rows],
+    )
+    conn.executemany("DELETE FROM outbox WHERE seq = ?", [(row[0],) for row in rows])
+    restored = [(issue_id,) for _, op, issue_id, _, _ in rows if op in ("delete", "archive")]
+    conn.executemany("UPDATE issues SET deleted = 0 WHERE id = ?", restored)
+    conn.executemany("DELETE FROM archive WHERE issue_id = ? AND in_sheet = 0", restored)
+    conn.executemany("DELETE FROM issues WHERE id = ? AND in_sheet = 0", [(i,) for i in unsent])
+    return len(rows)
+
+
+def dead_letters():
+    """Changes set aside, newest first, as a frame for the dashboard."""
+    rows = _connection().execute(
+        "SELECT op, cells, error, set_at FROM dead_letters ORDER BY set_at DESC, seq DESC"
+    ).fetchall()
+    return pd.DataFrame(
+        [
+            (
+                op,
+                ", ".join(f"{col}: {value}" for col, value in json.loads(cells).items() if value != ""),
+                error,
+                pd.Timestamp.fromtimestamp(set_at).strftime("%d-%b %H:%M"),
+            )
+            for op, cells, error, set_at in rows
+        ],
+        columns=["Change", "Cells", "Error", "Set aside"],
+    )
+
+
+def clear_dead_letters():
+    with _transaction() as conn:
+        conn.execute("DELETE FROM dead_letters")
+
+
+def record_pull(error=None):
+    with _transaction() as conn:
+        if error is None:
+            _set_meta(conn, "pulled_at", time.time())
+        _set_meta(conn, "pull_error", None if error is None else str(error) or type(error).__name__)
+
+
+def replace(columns, rows):
+    """Mirror the worksheet (``rows`` of cell texts) if nothing is waiting to be pushed.
+
+    Stored rows are aligned with the worksheet's by content, so ids
+    survive a pull even when rows were inserted or deleted in the
+    worksheet; rows edited in place keep their ids too. Only rows that
+    changed are written: ``pos`` just has to keep the worksheet's order,
+    so rows around an insert or delete keep theirs. Returns False,
+    changing nothing, while the outbox is not empty.
+    """
+    with _transaction() as conn:
+        if conn.execute("SELECT 1 FROM outbox LIMIT 1").fetchone():
+            return False
+        held = conn.execute("SELECT id, pos, in_sheet, deleted, data FROM issues ORDER BY pos").fetchall()
+        new = [json.dumps(dict(zip(columns, cells))) for cells in rows]
+        paired = [None] * len(new)   # the stored row each worksheet row continues, if any
+        matcher = difflib.SequenceMatcher(None, [data for _, _, _, _, data in held], new)
+        for _, i1, i2, j1, j2 in matcher.get_opcodes():
+            # Matching runs pair up whole; a changed run pairs row by row
+            # and what is left over was deleted or inserted
+            n = min(i2 - i1, j2 - j1)
+            paired[j1:j1 + n] = held[i1:i1 + n]
+            conn.executemany("DELETE FROM issues WHERE id = ?", [(row[0],) for row in held[i1 + n:i2]])
+
+        positions = _positions([row[1] if row else None for row in paired])
+        for row, pos, data in zip(paired, positions, new):
+            if row is None:
+                conn.execute("INSERT INTO issues (pos, in_sheet, data) VALUES (?, 1, ?)", (pos, data))
+            elif row[1:] != (pos, 1, 0, data):
+                conn.execute(
+                    "UPDATE issues SET pos = ?, in_sheet = 1, deleted = 0, data = ? WHERE id = ?", (pos, data, row[0]),
+                )
+        _set_meta(conn, "header", columns)
+    return True
+
+
+def _positions(kept):
+    # Sort keys for the worksheet's rows: rows that were stored keep theirs
+    # (``kept``, already in order), new ones are spread over the gaps
+    positions = list(kept)
+    j = 0
+    while j < len(positions):
+        if positions[j] is not None:
+            j += 1
+            continue
+        k = j
+        while k < len(positions) and positions[k] is None:
+            k += 1
+        low = positions[j - 1] if j else 0
+        high = positions[k] if k < len(positions) else low + (k - j) + 1
+        step = (high - low) / (k - j + 1)
+        for n in range(j, k):
+            positions[n] = low + step * (n - j + 1)
+        j = k
+    if any(a >= b for a, b in zip(positions, positions[1:])):
+        return list(range(1, len(positions) + 1))   # gaps worn too thin: renumber
+    return positions
+
+
+# -------------------- ARCHIVE --------------------
+def archive_closed(column, before):
+    """Move live rows whose ``column`` date is before ``before`` (ISO) to the archive.
+
+    Rows with changes still queued are left for a later sweep. Each moved
+    row is queued as an ``archive`` change; until it is pushed it shows in
+    the archive and not in the hot set. Returns the number of rows moved.
+    """
+    path = _path(column)
+    with _transaction() as conn:
+        rows = conn.execute(
+            "SELECT id, data FROM issues WHERE deleted = 0 AND in_sheet = 1"
+            " AND json_extract(data, ?) != '' AND json_extract(data, ?) < ?"
+            " AND id NOT IN (SELECT issue_id FROM outbox)",
+            (path, path, before),
+        ).fetchall()
+        for issue_id, data in rows:
+            conn.execute("UPDATE issues SET deleted = 1 WHERE id = ?", (issue_id,))
+            conn.execute("INSERT INTO archive (issue_id, in_sheet, data) VALUES (?, 0, ?)", (issue_id, data))
+            conn.execute("INSERT INTO outbox (op, issue_id, cells) VALUES ('archive', ?, ?)", (issue_id, data))
+    return len(rows)
+
+
+def unsent_archive(ids):
+    """``[(issue_id, cells)]`` of archived rows not yet in the archive worksheet."""
+    wanted = set(ids)
+    rows = _connection().execute("SELECT issue_id, data FROM archive WHERE in_sheet = 0 ORDER BY id").fetchall()
+    return [(issue_id, json.loads(data)) for issue_id, data in rows if issue_id in wanted]
+
+
+def archive_sent(ids):
+    with _transaction() as conn:
+        conn.executemany("UPDATE archive SET in_sheet = 1 WHERE issue_id = ?", [(i,) for i in ids])
+
+
+def archive_count():
+    return _connection().execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+
+def load_archive(start, stop):
+    """Archived rows ``start:stop``, most recently archived first, as a text frame."""
+    rows = _connection().execute(
+        "SELECT id, data FROM archive ORDER BY id DESC LIMIT ? OFFSET ?", (stop - start, start)
+    ).fetchall()
+    df = pd.DataFrame(
+        [json.loads(data) for _, data in rows], columns=header() or [], index=pd.Index([i for i, _ in rows], name="id"),
+    )
+    return df.fillna("")
+
+
+def replace_archive(columns, rows):
+    """Mirror the archive worksheet, unless archived rows are still waiting to reach it."""
+    with _transaction() as conn:
+        if conn.execute("SELECT 1 FROM archive WHERE in_sheet = 0 LIMIT 1").fetchone():
+            return False
+        conn.execute("DELETE FROM archive")
+        conn.executemany(
+            "INSERT INTO archive (in_sheet, data) VALUES (1, ?)",
+            [(json.dumps(dict(zip(columns, cells))),) for cells in rows],
+        )
+        _set_meta(conn, "archive_pulled_at", time.time())
+        _set_meta(conn, "archive_pull_error", None)
+    return True
+
+
+def record_archive_pull(error):
+    with _transaction() as conn:
+        _set_meta(conn, "archive_pull_error", str(error) or type(error).__name__)
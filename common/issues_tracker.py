@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from datetime import datetime
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from itertools import takewhile
 
+from common import issue_store
+from common.dates import parse_dates
+from common.filter_index import ALL
+from common.pagination import paginate
+from common.snapshot_store import source_lock
 
 
-st.markdown("""
+# Injected by main(): importing this module must not draw anything
+STYLE = """
 <style>
 /* Page padding */
 .block-container {
@@ -63,51 +72,570 @@ st.markdown("""
     margin-top: 1.5rem;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 
+# -------------------- SHEET CONNECTION --------------------
+SPREADSHEET_KEY = "13sIsY5Cy1Pq-it9cX5WNPoz2RI76EjsnPJ73D4PKsag"
+WORKSHEET_NAME = "Daily_Issue_Tracking"
+ARCHIVE_WORKSHEET = "Daily_Issue_Archive"   # closed issues past ARCHIVE_AFTER_DAYS
 
+_worksheet = None   # process-wide handle, shared by loads and saves
+_connect_lock = threading.Lock()
+
+
+def _connect():
+    import gspread  # heavy; only needed once the tracker talks to the sheet
 
-def get_sheet():
     creds = dict(st.secrets["gcp_service_account"])
     creds["private_key"] = creds["private_key"].replace("\\n", "\n")
 
     gc = gspread.service_account_from_dict(creds)
-    sh = gc.open_by_key("13sIsY5Cy1Pq-it9cX5WNPoz2RI76EjsnPJ73D4PKsag")
-    return sh.worksheet("Daily_Issue_Tracking")
-
-
-st.success("Connected to Google Sheet successfully ✅")
-
-
-@st.cache_data(ttl=20)
-def load_data():
-    ws = get_sheet()
-    df = pd.DataFrame(ws.get_all_records())
-
-    if df.empty:
-        return pd.DataFrame(columns=COLUMNS)
-
-    # Convert date columns correctly
+    sh = gc.open_by_key(SPREADSHEET_KEY)
+    return sh.worksheet(WORKSHEET_NAME)
+
+
+def get_sheet(reconnect=False):
+    """The tracker worksheet, connected once per process.
+
+    The client keeps its OAuth token and refreshes it when it expires, so
+    after the first call a tracker read or write costs only its own
+    request: no credential, spreadsheet or worksheet lookups.
+    """
+    global _worksheet
+    with _connect_lock:
+        if _worksheet is None or reconnect:
+            _worksheet = _connect()
+        return _worksheet
+
+
+def _stale(exc, write):
+    # Errors after which reconnecting and repeating the call is safe
+    import requests
+    from google.auth.exceptions import RefreshError, TransportError
+    from gspread.exceptions import APIError
+
+    if isinstance(exc, (RefreshError, TransportError)):
+        return True   # token refresh failed; the request itself never went out
+    if isinstance(exc, APIError):
+        # 401/404: rejected outright (expired auth, worksheet re-created)
+        return exc.code in ((401, 404) if write else (401, 404, 429, 500, 502, 503, 504))
+    # A dropped connection may still have delivered a write
+    return not write and isinstance(exc, requests.ConnectionError)
+
+
+def _transient(exc):
+    # The sheet was unreachable or busy rather than rejecting the change:
+    # retried for as long as it takes, never set aside
+    return isinstance(exc, OSError) or _stale(exc, write=False)
+
+
+def with_sheet(call, write=False):
+    """``call(worksheet)`` on the shared handle, reconnecting once if it went stale."""
+    try:
+        return call(get_sheet())
+    except Exception as exc:
+        if not _stale(exc, write):
+            raise
+    return call(get_sheet(reconnect=True))
+
+
+# -------------------- INCREMENTAL SYNC --------------------
+SYNC_WINDOW = 500        # trailing rows re-read when the sheet has changed
+FULL_SYNC_EVERY = 600    # seconds between full reads, which pick up edits above the window
+
+# The frame as last read, plus what is needed to tell how the sheet moved on
+_sync = {}   # "df", "header", "modified", "grid_rows", "full_at"
+_sync_lock = threading.Lock()
+
+
+def _typed(rows, header, index=None, stored=False):
+    # Raw cell strings -> the tracker frame: text, with date columns as dates.
+    # stored: text from the issue store, whose dates are always ISO; only the
+    # worksheet's own text goes through (and trains) the remembered format
+    width = len(header)
+    rows = [list(row[:width]) + [""] * (width - len(row)) for row in rows]  # reads trim trailing blanks
+    df = pd.DataFrame(rows, columns=header, index=index, dtype=object)
     for col in DATE_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
-
+            if stored:
+                df[col] = parse_dates(df[col], fmt=STORED_DATE_FORMAT).dt.date
+            else:
+                df[col] = parse_dates(df[col], key=(WORKSHEET_NAME, col)).dt.date
     return df
 
-# -------------------- SAVE DATA --------------------
-def save_data(df):
-    ws = get_sheet()
 
-    # Convert dates back to string for Google Sheets
-    for col in DATE_COLUMNS:
-        if col in df.columns:
-            df[col] = df[col].astype(str).replace("NaT", "")
+def _header(row):
+    row = list(row)
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+def _grid_rows(ws):
+    # Grid size changes on row inserts/deletes, not on edits
+    meta = ws.spreadsheet.fetch_sheet_metadata({"fields": "sheets.properties"})
+    for sheet in meta["sheets"]:
+        if sheet["properties"]["sheetId"] == ws.id:
+            return sheet["properties"]["gridProperties"]["rowCount"]
+    return None
+
+
+def _read_worksheet():
+    """The tracker frame, re-reading as little of the worksheet as possible.
+
+    A Drive ``modifiedTime`` probe comes first: while it is unchanged the
+    held frame is returned without reading any cells. After a change only
+    the last ``SYNC_WINDOW`` rows (and anything appended) are read and
+    merged in. Rows are read as raw values, never as per-row dicts; the
+    worker's own pushes are patched into the held frame (``_patch_held``).
+    A full read happens on first use, after a failed push, when rows were
+    inserted or deleted (the grid moved by more than the appended rows, or
+    the row just above the window changed), when the header changed, and once
+    ``FULL_SYNC_EVERY`` seconds have passed since the last one, whatever
+    the probe says: an edit above the window is only seen by a full read.
+    """
+    with _sync_lock:
+        modified = with_sheet(lambda ws: ws.spreadsheet.get_lastUpdateTime())
+        held = _sync.get("df")
+        due = held is None or time.monotonic() - _sync["full_at"] >= FULL_SYNC_EVERY
+        if not due and modified == _sync["modified"]:
+            return held
+
+        grid_rows = with_sheet(_grid_rows)
+        df = None
+        if not due and len(held) and grid_rows is not None and grid_rows >= _sync["grid_rows"]:
+            from gspread.utils import rowcol_to_a1
+
+            # The window starts one held row early: if that anchor row moved,
+            # rows were inserted or deleted above and positions no longer line up
+            start = max(1, len(held) - SYNC_WINDOW)
+            last_col = rowcol_to_a1(1, len(_sync["header"]))[:-1]
+            header, window = with_sheet(lambda ws: ws.batch_get(["1:1", f"A{start + 1}:{last_col}"]))
+            header = _header(header[0] if header else [])
+            if header == _sync["header"] and window:
+                anchor = _typed(window[:1], header)
+                merged = pd.concat([held.iloc[:start], _typed(window[1:], header)], ignore_index=True)
+                appended = len(merged) - len(held)
+                same_anchor = anchor.astype(str).equals(held.iloc[start - 1:start].reset_index(drop=True).astype(str))
+                if same_anchor and grid_rows - _sync["grid_rows"] <= max(appended, 0):
+                    df = merged
+
+        if df is None:
+            values = with_sheet(lambda ws: ws.get_values())
+            header = _header(values[0]) if values else list(COLUMNS)
+            df = _typed(values[1:], header)
+            _sync["full_at"] = time.monotonic()
+
+        _sync.update(df=df, header=header, modified=modified, grid_rows=grid_rows)
+        return df
+
+
+def _reset_sync():
+    with _sync_lock:
+        _sync.clear()
+
+
+def _patch_held(before, updates=None):
+    """Mirror a push into the held frame, so the next read only needs the window.
+
+    ``before`` maps worksheet row numbers to their cells as read just
+    before the push; ``updates`` maps some of them to the cells written.
+    The other rows in ``before`` were deleted. If the held frame does not
+    hold those rows where the worksheet had them, it is dropped and the
+    next read is a full one.
+    """
+    with _sync_lock:
+        held = _sync.get("df")
+        if held is None or not before:
+            return
+        header = _sync["header"]
+        positions = sorted(before)
+        if (header != issue_store.header() or positions[0] < 2 or positions[-1] - 2 >= len(held)
+                or _sheet_values(held.iloc[[p - 2 for p in positions]]).values.tolist()
+                != _normalised([before[p] for p in positions], header)):
+            _sync.clear()
+            return
+
+        df = held.copy()
+        changed = sorted(updates or {})
+        typed = _typed([[updates[p].get(c, "") for c in header] for p in changed], header, stored=True)
+        for n, p in enumerate(changed):
+            for col in updates[p]:
+                if col in header:
+                    df.iat[p - 2, header.index(col)] = typed.iat[n, header.index(col)]
+        gone = [p - 2 for p in positions if p not in changed]
+        if gone:
+            df = df.drop(index=df.index[gone]).reset_index(drop=True)
+        grid_rows = _sync["grid_rows"]
+        _sync.update(df=df, grid_rows=grid_rows - len(gone) if grid_rows is not None else None)
+
+
+# -------------------- WRITE-BEHIND --------------------
+PULL_EVERY = 20                # seconds between worksheet pulls while nothing is queued
+RETRY_MIN, RETRY_MAX = 5, 300  # backoff after a failed push or pull, doubling
+MAX_REJECTIONS = 5             # rejected pushes before a queued change is set aside
+OUTBOX_SOURCE = "common/issue_outbox"   # lock name: one process on the host syncs at a time
+
+# Issues closed (Actual Closure Date) longer ago than this leave the editor
+ARCHIVE_AFTER_DAYS = int(os.environ.get("NPI_ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_PULL_EVERY = 3600      # seconds between archive worksheet pulls
+
+_worker = None
+_worker_lock = threading.Lock()
+_mirrored = None   # frame last mirrored into the store
+_archive_ws = None   # (tracker worksheet, archive worksheet) handles
+_archive_retry_at = 0   # monotonic time before which a failed archive pull isn't retried
+
+
+def _normalised(rows, header, stored=False):
+    # Compare cells the way the store holds them, whatever the sheet's date format
+    return _sheet_values(_typed(rows, header, stored=stored)).values.tolist()
+
+
+def _last_col(header):
+    from gspread.utils import rowcol_to_a1
+
+    return rowcol_to_a1(1, len(header))[:-1]
+
+
+def _read_rows(rows, entries, header):
+    # {issue id: its worksheet row's cells, exactly as the worksheet has them}
+    ranges = [f"A{rows[issue_id]}:{_last_col(header)}{rows[issue_id]}" for _, _, issue_id, _, _ in entries]
+    if not ranges:
+        return {}
+    found = with_sheet(lambda ws: ws.batch_get(ranges))
+    return {
+        issue_id: list(cells[:len(header)]) + [""] * (len(header) - len(cells))
+        for (_, _, issue_id, _, _), cells in zip(entries, [values[0] if values else [] for values in found])
+    }
+
+
+def _identity(row, header, columns):
+    # The IDENTITY_COLUMNS among ``columns`` of a normalised row
+    return tuple(row[header.index(col)] for col in IDENTITY_COLUMNS if col in columns and col in header)
+
+
+def _located(rows, entries, header):
+    # The row number is only as current as the last pull, and pulls wait
+    # while changes are queued: check each row still holds its issue, and
+    # look for the ones that moved in the whole worksheet. Returns the
+    # entries that can be placed (the rest are set aside) and the rows
+    # as read.
+    raw = _read_rows(rows, entries, header)
+    expected = issue_store.sheet_cells(raw)
+    ids = list(raw)
+    wants = _normalised([[expected.get(issue_id, {}).get(c, "") for c in header] for issue_id in ids], header, stored=True)
+    gots = _normalised([raw[issue_id] for issue_id in ids], header)
+    moved = []
+    for issue_id, want, got in zip(ids, wants, gots):
+        cells = expected.get(issue_id, {})
+        if _identity(want, header, cells) != _identity(got, header, cells):
+            moved.append((issue_id, _identity(want, header, cells), cells))
+    if not moved:
+        return entries, raw
+
+    _reset_sync()   # the held frame no longer lines up with the store's rows
+    values = with_sheet(lambda ws: ws.get_values())
+    sheet = _normalised(values[1:], header)
+    lost = set()
+    for issue_id, want, cells in moved:
+        hits = [n for n, row in enumerate(sheet) if _identity(row, header, cells) == want]
+        if len(hits) == 1:
+            rows[issue_id] = hits[0] + 2
+        else:
+            lost.add(issue_id)
+    if lost:
+        issue_store.reject(
+            [seq for seq, _, issue_id, _, _ in entries if issue_id in lost],
+            "the issue's row could not be found in the worksheet",
+        )
+    return [entry for entry in entries if entry[2] not in lost], raw
+
+
+def _push_updates(entries):
+    from gspread.utils import rowcol_to_a1
+
+    header = issue_store.header()
+    rows = issue_store.sheet_rows([issue_id for _, _, issue_id, _, _ in entries])
+    placed, raw = _located(rows, [entry for entry in entries if entry[2] in rows], header)
+    data = [
+        {"range": rowcol_to_a1(rows[issue_id], header.index(col) + 1), "values": [[value]]}
+        for _, _, issue_id, cells, _ in placed
+        for col, value in cells.items() if col in header
+    ]
+    if data:
+        with_sheet(lambda ws: ws.batch_update(data), write=True)
+    written = {}
+    for _, _, issue_id, cells, _ in placed:
+        written.setdefault(rows[issue_id], {}).update(cells)
+    _patch_held({rows[issue_id]: raw[issue_id] for _, _, issue_id, _, _ in placed}, written)
+    issue_store.acknowledge([seq for seq, _, _, _, _ in entries])
+
+
+def _archive_sheet(ws, header, create=False):
+    # The archive worksheet next to ``ws``; None while there is none, unless
+    # ``create`` (an archive push), which adds it headed with ``header``
+    global _archive_ws
+    if _archive_ws is None or _archive_ws[0] is not ws:
+        from gspread.exceptions import WorksheetNotFound
+
+        try:
+            archive = ws.spreadsheet.worksheet(ARCHIVE_WORKSHEET)
+        except WorksheetNotFound:
+            if not create:
+                return None
+            archive = ws.spreadsheet.add_worksheet(ARCHIVE_WORKSHEET, rows=1, cols=len(header))
+        _archive_ws = (ws, archive)
+    archive = _archive_ws[1]
+    if create and not archive.row_values(1):
+        archive.append_row(header)
+    return archive
+
+
+def _verified(entries):
+    # Worksheet row numbers, the entries whose row still holds the queued
+    # contents, and those rows' cells exactly as the worksheet has them
+    header = issue_store.header()
+    rows = issue_store.sheet_rows([issue_id for _, _, issue_id, _, _ in entries])
+    missing = [entry for entry in entries if entry[2] not in rows]
+    if missing:
+        # Rows the worksheet never got: nothing to remove there
+        issue_store.acknowledge(
+            [seq for seq, _, _, _, _ in missing], deleted=[issue_id for _, _, issue_id, _, _ in missing],
+        )
+    entries = [entry for entry in entries if entry[2] in rows]
+    raw = _read_rows(rows, entries, header)
+
+    # A row that no longer holds what was deleted means the worksheet moved
+    # on underneath: keep the row rather than delete the wrong one
+    targets, kept = [], []
+    expected = _normalised([[cells.get(c, "") for c in header] for _, _, _, cells, _ in entries], header, stored=True)
+    actual = _normalised([raw[issue_id] for _, _, issue_id, _, _ in entries], header)
+    for entry, want, got in zip(entries, expected, actual):
+        (targets if want == got else kept).append(entry)
+    if kept:
+        issue_store.acknowledge([seq for seq, _, _, _, _ in kept], restored=[issue_id for _, _, issue_id, _, _ in kept])
+    return rows, targets, raw
+
+
+def _delete_rows(rows, targets):
+    # Bottom-up, so the row numbers still to delete stay valid
+    targets.sort(key=lambda entry: rows[entry[2]])
+    for first, last in reversed(_runs([rows[issue_id] for _, _, issue_id, _, _ in targets])):
+        run = [entry for entry in targets if first <= rows[entry[2]] <= last]
+        with_sheet(lambda ws: ws.delete_rows(first, last), write=True)
+        issue_store.acknowledge([seq for seq, _, _, _, _ in run], deleted=[issue_id for _, _, issue_id, _, _ in run])
+
+
+def _push_deletes(entries):
+    rows, targets, raw = _verified(entries)
+    _delete_rows(rows, targets)
+    _patch_held({rows[issue_id]: raw[issue_id] for _, _, issue_id, _, _ in targets})
+
+
+def _push_archives(entries):
+    # Copied to the archive worksheet before leaving the tracker: an
+    # interruption in between leaves a row in both, never in neither
+    rows, targets, raw = _verified(entries)
+    header = issue_store.header()
+    unsent = issue_store.unsent_archive([issue_id for _, _, issue_id, _, _ in targets])
+    if unsent:
+        # The worksheet's own cells, not the store's normalised copy: free
+        # text in date columns and the sheet's date format survive the move
+        new_rows = [raw[issue_id] for issue_id, _ in unsent]
+        with_sheet(lambda ws: _archive_sheet(ws, header, create=True).append_rows(new_rows), write=True)
+        issue_store.archive_sent([issue_id for issue_id, _ in unsent])
+    _delete_rows(rows, targets)
+    _patch_held({rows[issue_id]: raw[issue_id] for _, _, issue_id, _, _ in targets})
+
+
+def _push_appends(entries):
+    header = issue_store.header()
+    size = issue_store.sheet_size()
+    new_rows = [[cells.get(c, "") for c in header] for _, _, _, cells, _ in entries]
+
+    if entries[0][4]:
+        # Retrying: the last attempt may have landed before its response was lost
+        tail = with_sheet(lambda ws: ws.get_values(f"A{size + 2}:{_last_col(header)}{size + 1 + len(new_rows)}"))
+        pairs = zip(_normalised(tail, header), _normalised(new_rows, header, stored=True)) if tail else ()
+        landed = sum(1 for _ in takewhile(lambda pair: pair[0] == pair[1], pairs))
+        if landed:
+            issue_store.acknowledge(
+                [seq for seq, _, _, _, _ in entries[:landed]],
+                appended=[issue_id for _, _, issue_id, _, _ in entries[:landed]],
+            )
+            entries, new_rows = entries[landed:], new_rows[landed:]
+            if not entries:
+                return
+
+    if not size and not with_sheet(lambda ws: ws.row_values(1)):
+        with_sheet(lambda ws: ws.append_row(header), write=True)
+    with_sheet(lambda ws: ws.append_rows(new_rows), write=True)
+    issue_store.acknowledge(
+        [seq for seq, _, _, _, _ in entries], appended=[issue_id for _, _, issue_id, _, _ in entries],
+    )
+
 
-    ws.clear()
-    ws.update([df.columns.tolist()] + df.fillna("").values.tolist())
+_PUSH = {"update": _push_updates, "delete": _push_deletes, "append": _push_appends, "archive": _push_archives}
+
+
+def _push():
+    # Oldest first; consecutive changes of one kind go out as one batch
+    while True:
+        issue_store.set_aside(MAX_REJECTIONS)
+        queued = issue_store.pending()
+        if not queued:
+            return
+        op = queued[0][1]
+        run = list(takewhile(lambda entry: entry[1] == op, queued))
+        if run[0][4]:
+            run = run[:1]   # failed before: retried alone, so one bad change cannot sink a batch
+        try:
+            _PUSH[op](run)
+        except Exception as exc:
+            _reset_sync()   # what landed is unknown: the next pull re-reads the whole sheet
+            issue_store.fail(run[0][0], exc, rejected=not _transient(exc))
+            raise
+
+
+def _pull():
+    # Mirror the worksheet into the store, unless changes are still queued
+    global _mirrored
+    try:
+        df = _read_worksheet()
+    except Exception as exc:
+        issue_store.record_pull(exc)
+        raise
+    if df is not _mirrored and issue_store.replace(list(df.columns), _sheet_values(df).values.tolist()):
+        _mirrored = df
+    issue_store.record_pull()
+
+
+def _pull_archive():
+    header = issue_store.header()
+    archived = lambda archive: archive.get_values() if archive is not None else []
+    values = with_sheet(lambda ws: archived(_archive_sheet(ws, header)))
+    columns = _header(values[0]) if values else header
+    issue_store.replace_archive(columns, _normalised(values[1:], columns))
+
+
+def _sync_once():
+    global _archive_retry_at
+    _push()
+    sync = issue_store.status()
+    if time.time() - sync["pulled_at"] >= PULL_EVERY:
+        _pull()
+        cutoff = date.today() - timedelta(days=ARCHIVE_AFTER_DAYS)
+        if issue_store.archive_closed("Actual Closure Date", cutoff.isoformat()):
+            _push()
+    if time.time() - sync["archive_pulled_at"] >= ARCHIVE_PULL_EVERY and time.monotonic() >= _archive_retry_at:
+        # On its own: a failed archive pull doesn't back off the issue sync
+        try:
+            _pull_archive()
+        except Exception as exc:
+            issue_store.record_archive_pull(exc)
+            _archive_retry_at = time.monotonic() + RETRY_MAX
+
+
+def _sync_loop():
+    delay, retry_at = 0, 0
+    while True:
+        time.sleep(1)
+        if time.monotonic() < retry_at:
+            continue
+        with source_lock(OUTBOX_SOURCE, blocking=False) as acquired:
+            if not acquired:
+                continue   # another process on this host is syncing
+            try:
+                _sync_once()
+                delay = 0
+            except Exception:
+                delay = min(max(delay * 2, RETRY_MIN), RETRY_MAX)
+                retry_at = time.monotonic() + delay
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_sync_loop, name="issue-sync", daemon=True)
+            _worker.start()
+
+
+def _ensure_store():
+    # The very first load on a host fills the store from the worksheet;
+    # after that the sync worker keeps it current in the background
+    if issue_store.header() is None:
+        _pull()
+    _ensure_worker()
+
+
+def load_data(equal=None, between=None):
+    """The hot set of the tracker from the local store, indexed by issue id.
+
+    ``equal``/``between`` select a partition (see ``issue_store.load``).
+    Long-closed issues are in the archive instead.
+    """
+    _ensure_store()
+    df = issue_store.load(equal, between)
+    return _typed(df.values.tolist(), list(df.columns), index=df.index, stored=True)
 
-    st.cache_data.clear()
+# -------------------- SAVE DATA --------------------
+def _sheet_values(df):
+    # The frame as the sheet holds it: dates as text, blanks as ""
+    values = df.astype(object)
+    for col in DATE_COLUMNS:
+        if col in values.columns:
+            values[col] = df[col].astype(str).replace(["NaT", "None", "nan"], "")
+    return values.where(values.notna(), "")
+
+
+def _runs(numbers):
+    # Sorted ints -> [(first, last), ...] of consecutive runs
+    runs = []
+    for n in numbers:
+        if runs and n == runs[-1][1] + 1:
+            runs[-1][1] = n
+        else:
+            runs.append([n, n])
+    return [tuple(run) for run in runs]
+
+
+def _with_ids(edited, ids):
+    # Editor row positions -> issue ids; added rows get labels no issue has
+    labels = [ids[int(pos)] if 0 <= pos < len(ids) else -1 - n for n, pos in enumerate(edited.index)]
+    return edited.set_axis(labels)
+
+
+def save_data(original, edited):
+    """Commit the difference between the loaded frame and the edited one locally.
+
+    ``original`` is indexed by issue id and may be any partition of the
+    tracker: rows outside it are left alone. ``edited`` is the
+    ``st.data_editor`` result, which keeps the labels of surviving rows
+    and gives new rows labels of their own. Only the changed cells of
+    each row are recorded, so concurrent editors do not overwrite each
+    other. The sync worker pushes the changes to the worksheet in the
+    background. Returns the number of rows updated/deleted/added.
+    """
+    columns = list(original.columns)
+    before = _sheet_values(original)
+    after = _sheet_values(edited.reindex(columns=columns))
+
+    kept = after.index.intersection(before.index)
+    deleted = before.index.difference(after.index)
+    added = after.index[~after.index.isin(before.index)]
+
+    changed = before.loc[kept] != after.loc[kept]
+    updates = {
+        int(label): {col: after.at[label, col] for col in changed.columns[row]}
+        for label, row in zip(changed.index, changed.to_numpy()) if row.any()
+    }
+    appends = [dict(zip(columns, row)) for row in after.loc[added].values.tolist()]
+    saved = issue_store.apply(updates, [int(label) for label in deleted], appends)
+    _ensure_worker()
+    return saved
 
 # -------------------- CONSTANTS --------------------
 COLUMNS = [
@@ -131,27 +659,89 @@ DATE_COLUMNS = [
     "Actual Closure Date"
 ]
 
+# What tells one issue's row from another's: an edit is only written to a
+# worksheet row that still holds these (other cells may be edited in the sheet)
+IDENTITY_COLUMNS = [
+    "Date",
+    "Product",
+    "Line / Area",
+    "Issue Description"
+]
+
+STORED_DATE_FORMAT = "%Y-%m-%d"   # how the issue store keeps dates (see _sheet_values)
+
+# Filters that pick the partition handed to the editor
+PARTITION_COLUMNS = {
+    "Product": "issue_product",
+    "Line / Area": "issue_line",
+    "Priority": "issue_priority",
+}
+
 
 def main():
+    st.markdown(STYLE, unsafe_allow_html=True)
     st.markdown("<div class='section-title'>📋 Daily Issues Tracker</div>", unsafe_allow_html=True)
 
-    df = load_data()
+    # Only the chosen partition is loaded and sent to the editor
+    _ensure_store()
+    f1, *boxes = st.columns(1 + len(PARTITION_COLUMNS))
+    with f1:
+        dates = st.date_input("Date range", value=(), key="issue_dates")
+    choices = {}
+    for box, (column, key) in zip(boxes, PARTITION_COLUMNS.items()):
+        with box:
+            choices[column] = st.selectbox(column, [ALL] + issue_store.distinct(column), key=key)
+    equal = {column: value for column, value in choices.items() if value != ALL}
+    between = {"Date": (dates[0].isoformat(), dates[1].isoformat())} if len(dates) == 2 else {}
+
+    df = load_data(equal, between)
+    sync = issue_store.status()
+    if sync["pending"]:
+        waiting = f"⏳ {sync['pending']} change(s) waiting to sync with Google Sheet"
+        if sync["error"]:
+            st.warning(f"{waiting} — last attempt failed ({sync['error']}), retrying.")
+        else:
+            st.info(waiting)
+    elif sync["pull_error"]:
+        pulled = datetime.fromtimestamp(sync["pulled_at"]).strftime("%H:%M:%S")
+        st.warning(
+            f"⚠️ Showing the local copy as of {pulled} — Google Sheets could not be reached "
+            f"({sync['pull_error']}). Retrying in the background."
+        )
+    else:
+        st.success("Connected to Google Sheet successfully ✅")
+    if sync["dead"]:
+        st.error(
+            f"❌ {sync['dead']} change(s) were rejected by Google Sheet and set aside "
+            f"({sync['dead_error']}). They are not in the sheet: re-enter them if still needed."
+        )
+        with st.expander("Changes set aside"):
+            st.dataframe(issue_store.dead_letters(), use_container_width=True, hide_index=True)
+            if st.button("Dismiss", key="issue_dead_dismiss"):
+                issue_store.clear_dead_letters()
+                st.rerun()
 
     if df.empty:
         df = pd.DataFrame(columns=COLUMNS)
 
+    # The editor gets row positions, not issue ids: with a range index new
+    # rows are numbered automatically instead of asking for an index value
     edited_df = st.data_editor(
-        df,
+        df.reset_index(drop=True),
         num_rows="dynamic",
         use_container_width=True,
+        hide_index=True,
         column_config={
-            "Date": st.column_config.DateColumn("Date"),
+            # New rows start inside the partition being edited
+            "Date": st.column_config.DateColumn("Date", default=dates[0] if len(dates) == 2 else None),
+            "Product": st.column_config.TextColumn("Product", default=equal.get("Product")),
+            "Line / Area": st.column_config.TextColumn("Line / Area", default=equal.get("Line / Area")),
             "Target Closure Date": st.column_config.DateColumn("Target Closure Date"),
             "Actual Closure Date": st.column_config.DateColumn("Actual Closure Date"),
             "Priority": st.column_config.SelectboxColumn(
                 "Priority",
                 options=["High", "Medium", "Low"],
-                default="Medium"
+                default=equal["Priority"] if equal.get("Priority") in ("High", "Low") else "Medium"
             ),
             "Impact": st.column_config.SelectboxColumn(
                 "Impact",
@@ -161,11 +751,34 @@ def main():
     )
 
     if st.button("💾 Save Changes"):
-        save_data(edited_df)
-        st.success("Changes saved and synced with Google Sheet ✅")
+        saved = save_data(df, _with_ids(edited_df, df.index))
+        if any(saved.values()):
+            st.success(
+                "Changes saved ✅ Syncing with Google Sheet in the background "
+                f"({saved['updated']} updated, {saved['added']} added, {saved['deleted']} deleted)"
+            )
+        else:
+            st.info("No changes to save")
 
     st.caption("Live sync with Google Sheets • Editable via Sheet or Dashboard")
 
+    # Read on demand, one page at a time
+    archived = issue_store.archive_count()
+    if st.toggle(f"🗄️ Show archive ({archived} closed issues)", key="issue_archive_open"):
+        st.caption(f"Issues closed more than {ARCHIVE_AFTER_DAYS} days ago, most recently archived first (read-only)")
+        if sync["archive_pull_error"]:
+            st.warning(
+                f"⚠️ The archive could not be read from Google Sheets ({sync['archive_pull_error']}). "
+                "Showing the local copy; retrying in the background."
+            )
+        shown = paginate(archived, key="issue_archive")
+        page = issue_store.load_archive(shown.start, shown.stop)
+        st.dataframe(
+            _typed(page.values.tolist(), list(page.columns), index=page.index, stored=True),
+            use_container_width=True,
+            hide_index=True,
+        )
+
 # -------------------- RUN --------------------
 if __name__ == "__main__":
     main()
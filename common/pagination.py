@@ -0,0 +1,36 @@
+"""Page controls for long dashboard tables.
+
+``paginate`` draws "Rows per page" / "Page" controls and returns the
+``slice`` of rows to show, so only that part of the (cached, filtered)
+frame is turned into HTML and sent to the browser. Payload and render
+time depend on the page size, not on how long the sheet has grown.
+"""
+import math
+
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 250]
+DEFAULT_PAGE_SIZE = 50
+
+
+def paginate(total, key, page_sizes=PAGE_SIZES, default=DEFAULT_PAGE_SIZE):
+    """Show page controls for ``total`` rows; return the visible rows as a slice.
+
+    The widgets use the keys ``<key>_size`` and ``<key>_page``.
+    """
+    c1, c2, c3 = st.columns([1, 1, 3])
+    with c1:
+        size = st.selectbox("Rows per page", page_sizes, index=page_sizes.index(default), key=f"{key}_size")
+
+    pages = max(1, math.ceil(total / size))
+    # Filters or a bigger page size can leave the remembered page past the end
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    with c2:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+
+    start = (page - 1) * size
+    end = min(start + size, total)
+    with c3:
+        st.caption(f"Rows {start + 1 if total else 0}–{end} of {total} • page {page} of {pages}")
+    return slice(start, end)
@@ -0,0 +1,75 @@
+"""Logical columns of each dashboard type, and how to find them in a sheet.
+
+Sheet headers drift ("Target Date", "Target Dt", "KPI's"...), so every
+dashboard matches its columns by keyword. The keyword lists live here,
+once per dashboard type: a logical column is found as the first header
+containing any of its keywords (case-insensitive) and none of its
+exclusions.
+
+``resolve`` caches the resulting ``{logical: header}`` mapping per header
+row, so a sheet is only scanned again when its header actually changes,
+and every model resolves the same way.
+"""
+from functools import lru_cache
+
+
+def column(*keywords, exclude=()):
+    return tuple(k.lower() for k in keywords), tuple(x.lower() for x in exclude)
+
+
+SCHEMAS = {
+    "readiness": {
+        "category": column("process category", "category"),
+        "sub": column("sub activity", "sub"),
+        "owner": column("owner"),
+        "target": column("target date", "target"),
+        "actual": column("actual date", "actual"),
+        "status": column("status"),
+        "remark": column("remarks", "remark"),
+    },
+    "plan": {
+        "wbs": column("wbs"),
+        "milestone": column("milestone"),
+        "plan": column("plan date", "plan"),
+        "actual": column("actual date", "actual"),
+        "remarks": column("remarks", "remark"),
+    },
+    "kpi": {
+        "kpi": column("KPI", "KPI's", "KPIs"),
+        "target": column("Target"),
+        "actual": column("Actual"),
+        "action": column("Action plan", "Action"),
+        "target_dt": column("Target Dt", "Target Date"),
+        "resp": column("Resp.", "Resp", "Responsible"),
+        "remarks": column("Remarks", "Remark"),
+    },
+    "mom": {
+        "date": column("date", exclude=["target"]),
+        "open_point": column("open point", "open"),
+        "resp": column("resp"),
+        "target_date": column("target date", "target dt"),
+        "status": column("status"),
+        "remarks": column("remark", "remarks"),
+    },
+}
+
+
+def _match(headers, keywords, exclude):
+    for header, lowered in headers:
+        if any(k in lowered for k in keywords) and not any(x in lowered for x in exclude):
+            return header
+    return None
+
+
+@lru_cache(maxsize=256)
+def _resolve(schema, header):
+    headers = [(h, str(h).lower().strip()) for h in header]
+    return tuple(
+        (name, _match(headers, keywords, exclude))
+        for name, (keywords, exclude) in SCHEMAS[schema].items()
+    )
+
+
+def resolve(schema, columns):
+    """``{logical name: sheet column or None}`` for a ``SCHEMAS`` entry and header row."""
+    return dict(_resolve(schema, tuple(columns)))
@@ -0,0 +1,397 @@
+"""Shared fetch layer for the published Google Sheet CSVs.
+
+Every dashboard goes through ``load_prepared`` instead of calling
+``pd.read_csv(CSV_URL)`` itself, so all sheets share one keep-alive
+connection pool and a model's sheets can be fetched concurrently.
+Refreshes are conditional GETs; when Google reports the sheet unchanged,
+or sends back the same bytes, the previously parsed frame is reused.
+
+Once a sheet has been loaded, a background thread re-fetches it shortly
+before it expires (stale-while-revalidate), so script runs are served
+the last good snapshot instantly and never wait on Google.
+
+Every fetched frame is also written to an on-disk snapshot (see
+``common.snapshot_store``); after a restart the first load is served
+from that file while the background refresher brings it up to date.
+
+When several Streamlit processes share the snapshot directory, only the
+one holding a source's lock re-fetches it; the others adopt the fresh
+snapshot from disk, so Google traffic does not grow with replicas.
+Within a process, concurrent loads of the same source are coalesced
+(single-flight): one request goes out and everyone else waits on it.
+
+A source whose fetches keep failing trips a circuit breaker: further
+attempts back off exponentially, script runs keep getting the last good
+snapshot, and ``stale_notice`` tells the dashboard to say so.
+
+``load_prepared`` also extends the cache past the download: a dashboard's
+whole normalize/annotate step runs once per data version (and day) and
+the result is shared by every rerun and session.
+"""
+import hashlib
+import io
+import threading
+import time
+from datetime import date
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.snapshot_store import (
+    materialize, read_snapshot, snapshot_age, snapshot_version, source_lock, touch_snapshot, write_snapshot,
+)
+
+REFRESH_INTERVAL = 30   # seconds a fetched sheet stays fresh
+FETCH_TIMEOUT = 10      # seconds per HTTP request
+MAX_WORKERS = 8         # concurrent downloads / pooled connections
+REFRESH_LEAD = 5        # re-fetch this many seconds before a sheet expires
+IDLE_AFTER = 600        # stop refreshing sheets nobody has read for this long
+BACKOFF_BASE = 5        # first retry delay after a failed fetch, doubled per failure
+BACKOFF_MAX = 300       # retry delay cap while a source keeps failing
+
+# -------------------- HTTP POOL --------------------
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sheet-fetch")
+
+# key -> {"fetch": fn(entry) -> entry, "name": snapshot name, "interval": seconds}
+_sources = {}
+# key -> {"df", "version", "etag", "last_modified", "fetched_at"}
+_cache = {}
+_last_used = {}
+_pending = set()
+_inflight = {}   # key -> Future of the one fetch currently running
+_breakers = {}   # key -> {"failures", "open_until", "error"} while failing
+_prepared = {}   # (key, prepare fn) -> (version, day, result)
+_refresher = None
+_lock = threading.Lock()
+
+
+# -------------------- PUBLISHED CSV --------------------
+def _download(url, entry):
+    # Returns (body, response); body is None when the server answers 304
+    headers = {"Accept-Encoding": "gzip"}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    resp = _session.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    if resp.status_code == 304 and entry:
+        return None, resp
+    resp.raise_for_status()
+    return resp.content, resp
+
+
+def _parse(content, header):
+    df = pd.read_csv(io.BytesIO(content), header=header)
+    if header is None:
+        # Raw grid: the caller does its own shaping (e.g. milestone)
+        return df
+    df = df.dropna(how='all').reset_index(drop=True)
+    df = df.fillna("—")
+    df = df.loc[:, ~df.columns.duplicated()]
+    return df
+
+
+def _csv_fetcher(url, header):
+    def fetch(entry):
+        content, resp = _download(url, entry)
+        version = entry["version"] if content is None else hashlib.sha1(content).hexdigest()
+        if entry and version == entry["version"]:
+            # Unchanged sheet: skip read_csv and keep the parsed frame
+            df = entry["df"]
+        else:
+            df = _parse(content, header)
+        return {
+            "df": df,
+            "version": version,
+            "etag": resp.headers.get("ETag") or (entry and entry["etag"]),
+            "last_modified": resp.headers.get("Last-Modified") or (entry and entry["last_modified"]),
+        }
+    return fetch
+
+
+# -------------------- CACHE --------------------
+def _register(key, fetch, name, interval):
+    with _lock:
+        if key not in _sources:
+            _sources[key] = {"fetch": fetch, "name": name, "interval": interval}
+
+
+def _fetch_remote(key):
+    source = _sources[key]
+    with _lock:
+        entry = _cache.get(key)
+    new = source["fetch"](entry)
+    new["fetched_at"] = time.monotonic()
+    with _lock:
+        _cache[key] = new
+
+    if source["name"]:
+        try:
+            if entry and new["version"] == entry["version"]:
+                touch_snapshot(source["name"])
+            else:
+                meta = {k: new[k] for k in ("version", "etag", "last_modified")}
+                write_snapshot(source["name"], new["df"], meta)
+                # Hold the file's view rather than the parsed frame, as the
+                # other processes do: the data then sits in memory once per host
+                snapshot = read_snapshot(source["name"])
+                if snapshot is not None:
+                    new["df"] = snapshot[0]
+        except OSError:
+            pass  # a missing snapshot only costs a cold start
+    return new
+
+
+def _from_disk(key, max_age=None):
+    # Seed the memory cache from the on-disk snapshot; None if there is
+    # none (or it is older than max_age)
+    source = _sources[key]
+    name = source["name"]
+    age = snapshot_age(name) if name else None
+    if age is None or (max_age is not None and age >= max_age):
+        return None
+
+    with _lock:
+        entry = _cache.get(key)
+    if entry and entry["version"] == snapshot_version(name):
+        # Same data as we hold: only the freshness moves
+        entry = dict(entry)
+    else:
+        snapshot = read_snapshot(name)
+        if snapshot is None:
+            return None
+        df, meta = snapshot
+        entry = {
+            "df": df,
+            "version": meta.get("version"),
+            "etag": meta.get("etag"),
+            "last_modified": meta.get("last_modified"),
+        }
+    # An old snapshot is still served, but comes up due for refresh
+    entry["fetched_at"] = time.monotonic() - min(age, source["interval"])
+    with _lock:
+        _cache[key] = entry
+    return entry
+
+
+def _fetch(key, wait=True):
+    source = _sources[key]
+    if not source["name"]:
+        return _fetch_remote(key)
+    with source_lock(source["name"], blocking=wait) as acquired:
+        if not acquired:
+            return None  # another process is refreshing it right now
+        # Did another process refresh it while we were waiting?
+        entry = _from_disk(key, max_age=source["interval"] - REFRESH_LEAD)
+        if entry:
+            return entry
+        return _fetch_remote(key)
+
+
+def _fetch_once(key, wait=True):
+    # Single-flight: the first caller fetches, the rest share its result
+    with _lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        if not wait:
+            return None
+        entry = future.result()
+        # The leader may have been a refresh that lost the cross-process race
+        return entry if entry is not None else _fetch_once(key)
+
+    with _lock:
+        breaker = _breakers.get(key)
+    if breaker and time.monotonic() < breaker["open_until"]:
+        # Breaker open: fail fast instead of waiting out another timeout
+        exc = RuntimeError(f"{_sources[key]['name'] or key} is unavailable: {breaker['error']}")
+        _land(key, future, exc=exc)
+        raise exc
+
+    try:
+        entry = _fetch(key, wait)
+    except BaseException as exc:
+        if isinstance(exc, Exception):
+            _trip(key, exc)
+        _land(key, future, exc=exc)
+        raise
+    if entry is not None:
+        with _lock:
+            _breakers.pop(key, None)
+    _land(key, future, entry=entry)
+    return entry
+
+
+def _trip(key, exc):
+    with _lock:
+        failures = _breakers.get(key, {}).get("failures", 0) + 1
+        delay = min(BACKOFF_BASE * 2 ** (failures - 1), BACKOFF_MAX)
+        _breakers[key] = {
+            "failures": failures,
+            "open_until": time.monotonic() + delay,
+            "error": str(exc) or type(exc).__name__,
+        }
+
+
+def _land(key, future, entry=None, exc=None):
+    # Retire the flight before waking the waiters, so a waiter that has to
+    # retry starts a new one instead of finding this one again
+    with _lock:
+        _inflight.pop(key, None)
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(entry)
+
+
+def _snapshot(key):
+    # Last good entry, or None when the sheet is unknown or has idled out
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        _last_used[key] = now
+    if entry is None:
+        return _from_disk(key)
+    if now - entry["fetched_at"] < IDLE_AFTER:
+        return entry
+    return None
+
+
+# -------------------- BACKGROUND REFRESH --------------------
+def _refresh(key):
+    try:
+        _fetch_once(key, wait=False)
+    except Exception:
+        pass  # keep serving the last good snapshot; retried next tick
+    finally:
+        with _lock:
+            _pending.discard(key)
+
+
+def _refresh_loop():
+    while True:
+        time.sleep(1)
+        now = time.monotonic()
+        with _lock:
+            due = [
+                key for key, entry in _cache.items()
+                if key not in _pending
+                and now - entry["fetched_at"] >= _sources[key]["interval"] - REFRESH_LEAD
+                and now - _last_used.get(key, 0) < IDLE_AFTER
+                and now >= _breakers.get(key, {}).get("open_until", 0)
+            ]
+            _pending.update(due)
+        for key in due:
+            _executor.submit(_refresh, key)
+
+
+def _ensure_refresher():
+    global _refresher
+    with _lock:
+        if _refresher is None:
+            _refresher = threading.Thread(target=_refresh_loop, name="sheet-refresher", daemon=True)
+            _refresher.start()
+
+
+def _load(key):
+    # The cache entry to serve; its frame is shared, copy before mutating
+    _ensure_refresher()
+    entry = _snapshot(key)
+    if entry:
+        return entry
+    try:
+        return _fetch_once(key)
+    except Exception:
+        # Idled-out snapshot: last known good beats an error page
+        with _lock:
+            entry = _cache.get(key)
+        if entry is None:
+            raise
+        return entry
+
+
+# -------------------- PUBLIC API --------------------
+def load_prepared(url, prepare, header="infer", name=None, args=()):
+    """Return ``(prepare(df, *args), version)`` for the sheet, computed once per data version.
+
+    ``prepare`` gets a private copy of the sheet and may only depend on
+    its contents, ``args`` (hashable: the sheet name, config flags, rule
+    sets) and today's date: the result is reused until any of them
+    changes, by every rerun and every session, so treat it as read-only.
+    ``version`` is the content hash of the data it was prepared from: key
+    anything derived from the result (rendered fragments) on it.
+
+    With the default header the sheet gets the usual dashboard cleanup
+    (blank rows dropped, NaN -> "—", duplicate columns removed); pass
+    ``header=None`` to get the raw grid. ``name`` (e.g.
+    ``"MERLIN/readiness"``) is where the sheet is snapshotted on disk.
+    Only the very first load of a sheet with no snapshot (or one idle
+    for ``IDLE_AFTER``) waits on the network.
+    """
+    key = (url, header)
+    _register(key, _csv_fetcher(url, header), name, REFRESH_INTERVAL)
+    entry = _load(key)
+    stage = (key, f"{prepare.__module__}.{prepare.__qualname__}", args)
+    today = date.today()
+    with _lock:
+        memo = _prepared.get(stage)
+    if memo and memo[0] == entry["version"] and memo[1] == today:
+        return memo[2], entry["version"]
+    result = prepare(materialize(entry["df"]), *args)
+    with _lock:
+        _prepared[stage] = (entry["version"], today, result)
+    return result, entry["version"]
+
+
+def stale_notice(name):
+    """Warning text while source ``name`` is served from an old snapshot.
+
+    Returns None when its last refresh succeeded.
+    """
+    now = time.monotonic()
+    with _lock:
+        for key, source in _sources.items():
+            breaker, entry = _breakers.get(key), _cache.get(key)
+            if source["name"] == name and breaker and entry:
+                age = now - entry["fetched_at"]
+                retry = max(0, breaker["open_until"] - now)
+                return (
+                    f"⚠️ Showing data from {_ago(age)} — Google Sheets could not be reached "
+                    f"({breaker['error']}). Retrying in {retry:.0f}s."
+                )
+    return None
+
+
+def _ago(seconds):
+    if seconds < 60:
+        return f"{seconds:.0f}s ago"
+    if seconds < 3600:
+        return f"{seconds // 60:.0f} min ago"
+    return f"{seconds // 3600:.0f} h ago"
+
+
+def prefetch(sheets):
+    """Warm the cache for several ``(url, header, name)`` sheets concurrently.
+
+    Sheets that already have a snapshot are skipped (the background
+    refresher keeps them current); the rest are downloaded in
+    parallel over the shared pool, so a cold model costs about one
+    round-trip instead of one per dashboard. Errors are left for the
+    dashboard that owns the sheet to report.
+    """
+    _ensure_refresher()
+    keys = []
+    for url, header, name in sheets:
+        key = (url, header)
+        _register(key, _csv_fetcher(url, header), name, REFRESH_INTERVAL)
+        keys.append(key)
+    futures = [_executor.submit(_fetch_once, key) for key in dict.fromkeys(keys) if _snapshot(key) is None]
+    for future in futures:
+        future.exception()
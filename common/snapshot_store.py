@@ -0,0 +1,153 @@
+"""On-disk snapshots of loaded dashboard data (Arrow IPC files).
+
+Each snapshot is one ``<SNAPSHOT_DIR>/<name>.arrow`` file, e.g.
+``MERLIN/readiness.arrow``, holding the normalized frame plus a small
+JSON metadata blob (content version, HTTP validators, column labels) in
+the Arrow schema. Files are replaced atomically, so a reader never sees
+a half-written snapshot.
+
+The snapshot directory doubles as the cache shared by every Streamlit
+process on the host: a file's mtime says when it was last confirmed
+fresh, and ``source_lock`` elects the one process that goes to the
+network for a source. The frames ``read_snapshot`` returns are views of
+the memory-mapped file (``pd.ArrowDtype`` columns), so every process
+serves the same page-cache bytes instead of holding its own copy of the
+data. What a process derives from a frame (``materialize`` it first) is
+still its own.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process election, every process fetches
+    fcntl = None
+
+SNAPSHOT_DIR = os.environ.get(
+    "NPI_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "snapshots"),
+)
+
+_META_KEY = b"npi_snapshot"
+
+
+def snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, *name.split("/")) + ".arrow"
+
+
+def _arrow_safe(df):
+    # Arrow needs one type per column: after fillna("—") numeric columns
+    # mix floats and strings, so render the odd values as text.
+    out = df.copy()
+    out.columns = [str(c) for c in df.columns]
+    for col in out.columns[out.dtypes.eq(object)]:
+        values = out[col]
+        kinds = set(type(v) for v in values.dropna())
+        if len(kinds) > 1:
+            out[col] = values.map(lambda v: v if isinstance(v, str) or pd.isna(v) else str(v))
+    return out
+
+
+def write_snapshot(name, df, meta=None):
+    """Persist ``df`` under ``name``; ``meta`` must be JSON-serializable."""
+    path = snapshot_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    table = pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+    blob = json.dumps({"meta": meta or {}, "columns": list(df.columns)}, default=str)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _META_KEY: blob.encode()})
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def read_snapshot(name):
+    """Return ``(df, meta)`` for the snapshot, or None if there is none.
+
+    ``df`` is a read-only view of the file: its columns are Arrow arrays
+    over the memory map, never copied into the process.
+    """
+    path = snapshot_path(name)
+    try:
+        with pa.memory_map(path, "r") as source:
+            table = ipc.open_file(source).read_all()
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+
+    blob = json.loads(table.schema.metadata[_META_KEY])
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    df.columns = blob["columns"]
+    return df, blob["meta"]
+
+
+def materialize(df):
+    """A copy of ``df`` with the dtypes a plain ``to_pandas()`` gives.
+
+    For code that transforms a ``read_snapshot`` frame: its Arrow-backed
+    columns become the usual pandas ones. Text columns still point at
+    the file (pandas' ``str`` dtype is Arrow-backed), the rest are copied.
+    """
+    out = df.copy()
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.ArrowDtype):
+            out.isetitem(i, pa.array(df.iloc[:, i].array).to_pandas().set_axis(df.index))
+    return out
+
+
+def snapshot_version(name):
+    """Content version recorded in the snapshot, read from the footer only."""
+    try:
+        with pa.memory_map(snapshot_path(name), "r") as source:
+            metadata = ipc.open_file(source).schema.metadata
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+    return json.loads(metadata[_META_KEY])["meta"].get("version")
+
+
+def snapshot_age(name):
+    """Seconds since the snapshot was written or last confirmed, or None."""
+    try:
+        return max(0.0, time.time() - os.stat(snapshot_path(name)).st_mtime)
+    except FileNotFoundError:
+        return None
+
+
+def touch_snapshot(name):
+    # Re-fetched but unchanged: mark it fresh for the other processes
+    try:
+        os.utime(snapshot_path(name))
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def source_lock(name, blocking=True):
+    """Cross-process lock for refreshing ``name``; yields whether it was acquired.
+
+    With ``blocking=False`` a process that loses the race gets False and
+    can simply pick up the winner's snapshot afterwards.
+    """
+    if fcntl is None:
+        yield True
+        return
+    path = snapshot_path(name) + ".lock"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a") as fh:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
@@ -0,0 +1,122 @@
+"""Row status rules, evaluated as whole-column masks.
+
+A rule set is an ordered list of ``(label, condition)`` pairs plus a
+default label: like an if/elif chain, the first condition that holds for
+a row gives its status. ``compile_rules`` turns one into a function that
+labels a whole frame with a single ``np.select``, so a 100k-row sheet
+costs a handful of vectorized comparisons instead of a Python call per
+row.
+
+Conditions name columns either directly ("Plan_Date") or by the logical
+names of a dashboard's detected ``cols`` ("status", "target"), so the
+same rule set serves every sheet layout. The rule sets live here; a
+dashboard uses its standard one unless the model's dashboard config
+picks another from ``RULE_SETS`` by name (see ``models.registry``).
+
+Date conditions parse through ``common.dates``; the status function's
+``source`` (the sheet name) keys the remembered formats per sheet.
+"""
+import numpy as np
+import pandas as pd
+
+from common.dates import parse_dates
+
+CLOSED_WORDS = ["closed", "close", "done"]
+OPEN_WORDS = ["open", "ongoing", "on going"]
+
+
+def _column(df, cols, name):
+    return df[cols.get(name, name)]
+
+
+def _dates(values, fmt, source):
+    return parse_dates(values, fmt=fmt, key=(source, values.name) if source else None)
+
+
+# -------------------- CONDITIONS --------------------
+# Each returns ``cond(df, cols, today, source)`` -> boolean mask over the rows.
+
+def text_in(col, words):
+    """Cell text, trimmed and lower-cased, is one of ``words``."""
+    words = [w.lower() for w in words]
+
+    def cond(df, cols, today, source):
+        return _column(df, cols, col).astype(str).str.strip().str.lower().isin(words)
+    return cond
+
+
+def has_date(col, fmt=None):
+    def cond(df, cols, today, source):
+        return _dates(_column(df, cols, col), fmt, source).notna()
+    return cond
+
+
+def before_today(col, fmt=None):
+    """Date is in the past; blanks and unparseable cells never are."""
+    def cond(df, cols, today, source):
+        return _dates(_column(df, cols, col), fmt, source) < today
+    return cond
+
+
+def on_or_before(col, other, fmt=None):
+    """``col`` <= ``other``; False when either date is missing."""
+    def cond(df, cols, today, source):
+        return _dates(_column(df, cols, col), fmt, source) <= _dates(_column(df, cols, other), fmt, source)
+    return cond
+
+
+def all_of(*conditions):
+    def cond(df, cols, today, source):
+        mask = np.ones(len(df), dtype=bool)
+        for c in conditions:
+            mask &= np.asarray(c(df, cols, today, source), dtype=bool)
+        return mask
+    return cond
+
+
+# -------------------- ENGINE --------------------
+def compile_rules(rules, default):
+    """Build ``status(df, cols=None, today=None, source=None)`` -> Series of labels."""
+    labels = [label for label, _ in rules]
+    conditions = [cond for _, cond in rules]
+
+    def status(df, cols=None, today=None, source=None):
+        cols = cols or {}
+        if today is None:
+            today = pd.Timestamp.today().normalize()
+        if df.empty or not conditions:
+            return pd.Series(default, index=df.index, dtype=object)
+        masks = [np.asarray(cond(df, cols, today, source), dtype=bool) for cond in conditions]
+        return pd.Series(np.select(masks, labels, default).astype(object), index=df.index)
+    return status
+
+
+# -------------------- COMMON RULE SETS --------------------
+# Readiness: the sheet's own Status wins; otherwise overdue targets are Delayed
+READINESS_RULES = compile_rules([
+    ("Closed", text_in("status", CLOSED_WORDS)),
+    ("Opened", text_in("status", OPEN_WORDS)),
+    ("Delayed", before_today("target")),
+], default="Opened")
+
+# Milestones: an actual date means finished (on time or late); otherwise
+# a plan date in the past means overdue
+MILESTONE_RULES = compile_rules([
+    ("Done", all_of(has_date("Actual_Date"), on_or_before("Actual_Date", "Plan_Date"))),
+    ("Delayed", has_date("Actual_Date")),
+    ("Overdue", before_today("Plan_Date")),
+], default="Pending")
+
+# Milestones that label on-time completion and missing actuals explicitly
+ON_TIME_MILESTONE_RULES = compile_rules([
+    ("Completed On Time", all_of(has_date("Actual_Date"), on_or_before("Actual_Date", "Plan_Date"))),
+    ("Delayed", has_date("Actual_Date")),
+    ("Overdue (No Actual)", before_today("Plan_Date")),
+], default="Pending")
+
+# Rule sets a dashboard config can name in its "rules" entry
+RULE_SETS = {
+    "readiness": READINESS_RULES,
+    "milestone": MILESTONE_RULES,
+    "milestone_on_time": ON_TIME_MILESTONE_RULES,
+}
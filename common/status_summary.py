@@ -0,0 +1,45 @@
+"""Status counts for a dashboard, computed in a single groupby.
+
+``summarize`` runs in ``prepare()`` (once per data version): one
+``groupby(...).size()`` over (category, owner, status) is rolled up into
+the overall totals, a per-category breakdown with percent closed and
+per-owner counts. Metric cards, banners and the progress panel then read
+these tables instead of re-scanning the frame on every rerun.
+"""
+import numpy as np
+
+from common.filter_index import ALL
+
+STATUSES = ["Delayed", "Opened", "Closed"]
+
+
+def _rollup(counts, level, statuses):
+    table = counts.groupby(level=[level, counts.index.names[-1]]).sum().unstack(fill_value=0)
+    table = table.reindex(columns=statuses, fill_value=0)
+    table["Total"] = table.sum(axis=1)
+    return table
+
+
+def summarize(df, status_col, category_col, owner_col, statuses=STATUSES):
+    counts = df.groupby([category_col, owner_col, status_col], dropna=False, sort=False).size()
+
+    totals = counts.groupby(level=status_col).sum().reindex(statuses, fill_value=0)
+    by_category = _rollup(counts, category_col, statuses)
+    by_category["% Closed"] = (100 * by_category["Closed"] / by_category["Total"]).round().astype(int)
+
+    return {
+        "counts": counts,
+        "totals": {s: int(n) for s, n in totals.items()},
+        "by_category": by_category,
+        "by_owner": _rollup(counts, owner_col, statuses),
+    }
+
+
+def count(summary, choices):
+    """Number of rows matching every ``{column: value}`` in ``choices`` ("All" = any)."""
+    counts = summary["counts"]
+    mask = np.ones(len(counts), dtype=bool)
+    for col, value in choices.items():
+        if value is not None and value != ALL:
+            mask &= counts.index.get_level_values(col) == value
+    return int(counts[mask].sum())
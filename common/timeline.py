@@ -0,0 +1,22 @@
+"""The "Timelines" banner shown above the readiness and milestone tables."""
+
+
+def timeline_html(milestones):
+    """Banner markup for ``[(gate, date), ...]``; the first gate is highlighted."""
+    items = "".join(
+        f"""
+                <div style="text-align:center;">
+                    <p style="font-size:1.5rem; font-weight:bold; color:{'#166534' if i == 0 else '#0c4a6e'}; margin:0;">{gate}</p>
+                    <p style="font-size:1.3rem; color:#0c4a6e; margin:8px 0 0 0;">{day}</p>
+                </div>"""
+        for i, (gate, day) in enumerate(milestones)
+    )
+    return f"""
+    <div style="background:#f0f9ff; padding:15px; border-radius:20px; margin:15px 0; box-shadow:0 8px 30px rgba(0,0,0,0.1); border:1px solid #bae6fd;">
+        <div style="text-align:center;">
+            <h3 style="color:#0c4a6e; font-size:1.8rem; margin:0 0 15px 0; font-weight:700;"> Timelines </h3>
+            <div style="display:flex; justify-content:center; gap:80px; flex-wrap:wrap;">{items}
+            </div>
+        </div>
+    </div>
+    """
@@ -0,0 +1,150 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from common.fragment_cache import cached_fragment
+from common.html_table import cells, column, rows
+from common.schema import resolve
+from common.sheet_loader import load_prepared, stale_notice
+
+
+
+def prepare(df):
+    # Column detection and the table selection; cached per data version
+    # Flexible column detection (handles apostrophe, spaces, case)
+    cols = resolve("kpi", df.columns)
+    kpi_col = cols["kpi"]
+    target_col = cols["target"]
+    actual_col = cols["actual"]
+    action_col = cols["action"]
+    target_dt_col = cols["target_dt"]
+    resp_col = cols["resp"]
+    remarks_col = cols["remarks"]
+    if not all([kpi_col, target_col, actual_col]):
+        return {"df": df, "cols": cols}
+
+    # Select columns
+    cols_to_show = [kpi_col, target_col, actual_col, action_col, target_dt_col, resp_col, remarks_col]
+    valid_cols = [c for c in cols_to_show if c is not None]
+    table_df = df[valid_cols].copy()
+
+    return {"df": df, "cols": cols, "table": table_df}
+
+
+def render_table(table_df, cols):
+    kpi_col = cols["kpi"]
+    target_col = cols["target"]
+    actual_col = cols["actual"]
+    action_col = cols["action"]
+    target_dt_col = cols["target_dt"]
+    resp_col = cols["resp"]
+    remarks_col = cols["remarks"]
+
+    # Beautiful KPI Table - Yellow Target/Actual Header
+    html = """
+    <div style="overflow-x:auto; margin:20px 0;">
+    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif;">
+        <thead>
+            <tr>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:left; font-weight:1000; width:28%;'>KPI's</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:center; font-weight:1000;'>Target</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:center; font-weight:1000;'>Actual</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:left; font-weight:1000;'>Action plan</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:center; font-weight:1000;'>Target Dt</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:center; font-weight:1000;'>Resp.</th>
+                <th style='background:#fbbf24; color:white; padding:15px; text-align:left; font-weight:1000;'>Remarks</th>
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+    target = column(table_df, target_col).astype(str)
+    actual = column(table_df, actual_col).astype(str)
+
+    # Light red background if Actual is worse than Target (for % values)
+    percent = target.str.contains("%", regex=False) & actual.str.contains("%", regex=False) & actual.ne("—")
+    t_val = pd.to_numeric(target.str.replace("%", "", regex=False).str.strip(), errors="coerce")
+    a_val = pd.to_numeric(actual.str.replace("%", "", regex=False).str.strip(), errors="coerce")
+    row_style = np.where(percent & (a_val < t_val), "background:#fee2e2;", "")
+
+    html += rows([
+        cells(table_df[kpi_col], "padding:12px; border:1px solid #e2e8f0; font-weight:bold;"),
+        cells(target, "padding:12px; border:1px solid #e2e8f0; text-align:center; font-weight:bold;"),
+        cells(actual, "padding:12px; border:1px solid #e2e8f0; text-align:center; font-weight:bold;"),
+        cells(column(table_df, action_col), "padding:12px; border:1px solid #e2e8f0;"),
+        cells(column(table_df, target_dt_col), "padding:12px; border:1px solid #e2e8f0; text-align:center;"),
+        cells(column(table_df, resp_col), "padding:12px; border:1px solid #e2e8f0; text-align:center;"),
+        cells(column(table_df, remarks_col), "padding:12px; border:1px solid #e2e8f0;"),
+    ], row_style=row_style)
+
+    html += """
+        </tbody>
+    </table>
+    </div>
+    """
+
+    return html
+
+
+def main(sheet):
+    # sheet: this model's entry from models.registry.sheet()
+    # Back button
+    #if st.button("← Back to Dashboard", key="back_merlin_kpi"):
+        #if 'dashboard' in st.session_state:
+         #   del st.session_state.dashboard
+        #st.rerun()
+
+    REFRESH_INTERVAL = 30
+
+    # Manual refresh
+    #col1, col2 = st.columns([1, 9])
+    #with col1:
+        #if st.button("🔄 Refresh"):
+            #st.rerun()
+
+    data, version = load_prepared(sheet["url"], prepare, name=sheet["name"])
+    notice = stale_notice(sheet["name"])
+    if notice:
+        st.warning(notice)
+
+    df = data["df"]
+    cols = data["cols"]
+    kpi_col = cols["kpi"]
+    target_col = cols["target"]
+    actual_col = cols["actual"]
+    action_col = cols["action"]
+    target_dt_col = cols["target_dt"]
+    resp_col = cols["resp"]
+    remarks_col = cols["remarks"]
+
+    # Beautiful Header - Purple Theme
+    st.markdown(f"""
+    <div style="text-align:center; padding:20px; background:linear-gradient(135deg, #d97706 0%, #f59e0b 100%); color:white; border-radius:16px; margin-bottom:20px; box-shadow: 0 12px 30px rgba(124,62,237,0.3);">
+        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:1000;"> {sheet['label']} KPI</h1>
+        <p style="margin:10px 0 0 0; font-size:1.1rem;">
+            Updated: {datetime.now().strftime("%d-%b-%Y %I:%M:%S %p")} • Auto-refresh every {REFRESH_INTERVAL}s
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Safety check
+    required = [kpi_col, target_col, actual_col]
+    if not all(required):
+        st.error(f"Required columns not found. Found: {df.columns.tolist()}")
+        st.stop()
+
+    table_df = data["table"]
+
+    html = cached_fragment((sheet["name"], version), lambda: render_table(table_df, cols))
+    st.markdown(html, unsafe_allow_html=True)
+
+    # Sidebar
+    with st.sidebar:
+        st.success(f"📊 {sheet['label']} KPIs")
+        st.download_button(
+            "📥 Download KPI Data",
+            df.to_csv(index=False).encode(),
+            sheet["filename"],
+            "text/csv"
+        )
@@ -0,0 +1,123 @@
+import streamlit as st
+from datetime import datetime
+
+from common.dates import parse_dates
+from common.fragment_cache import cached_fragment
+from common.html_table import cells, rows
+from common.sheet_loader import load_prepared, stale_notice
+from common.status_rules import MILESTONE_RULES, RULE_SETS
+from common.timeline import timeline_html
+
+STATUS_RULES = MILESTONE_RULES
+COLUMNS = ["Sub-Milestones", "Plan_Date", "Actual_Date", "Lead Time", "Remarks"]
+
+
+def prepare(raw, source=None, rules=None):
+    # Shape the raw grid (read with header=None, see models.registry.HEADERS),
+    # date-parse and annotate it; cached per data version. source: the sheet
+    # name, so date formats are remembered per sheet; rules: the config's
+    # RULE_SETS name, if it overrides STATUS_RULES
+    df = raw.iloc[1:]  # Skip header row
+    df = df.iloc[:, :len(COLUMNS)]   # first 5 columns
+    df = df.reindex(columns=range(len(COLUMNS)))  # sheets without a Remarks column
+    df.columns = COLUMNS
+    df = df.fillna("—")
+    df = df.reset_index(drop=True)
+
+    # Date parsing
+    df['Plan_Date']  = parse_dates(df['Plan_Date'], key=(source, 'Plan_Date'), dayfirst=True)
+    df['Actual_Date'] = parse_dates(df['Actual_Date'], key=(source, 'Actual_Date'), dayfirst=True)
+
+    # Status (used for light row coloring)
+    status_rules = RULE_SETS[rules] if rules else STATUS_RULES
+    df['Status'] = status_rules(df, source=source)
+
+    # Prepare display data
+    table_df = df.copy()
+    table_df['Plan_Date']  = table_df['Plan_Date'].dt.strftime('%d-%b-%y').fillna("—")
+    table_df['Actual_Date'] = table_df['Actual_Date'].dt.strftime('%d-%b-%y').fillna("—")
+
+    return table_df
+
+
+def render_table(table_df, remarks=True):
+    remarks_th = """<th style="padding:10px 10px; text-align:left;   font-weight:700; width:38%;">Remarks</th>""" if remarks else ""
+
+    # ── Slightly more compact table ─────────────────────────────────────────
+    html = f"""
+    <div style="overflow-x:auto; margin:12px 0;">
+    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif; font-size:0.94rem;">
+        <thead>
+            <tr style="background:#1e40af; color:white;">
+                <th style="padding:10px 10px; text-align:left; font-weight:700; width:24%;">Sub-Milestones</th>
+                <th style="padding:10px 8px; text-align:center; font-weight:700; width:14%;">Plan Date</th>
+                <th style="padding:10px 8px; text-align:center; font-weight:700; width:14%;">Actual Date</th>
+                <th style="padding:10px 8px; text-align:center; font-weight:700; width:10%;">Lead Time</th>
+                {remarks_th}
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+    row_bg = table_df['Status'].map({
+        "Done": "background:#f0fdf4;",
+        "Overdue": "background:#fef2f2;",
+        "Delayed": "background:#fef2f2;",
+    }).fillna("")
+    columns = [
+        cells(table_df['Sub-Milestones'], "padding:8px 10px; border:1px solid #e5e7eb;"),
+        cells(table_df['Plan_Date'], "padding:8px 8px; border:1px solid #e5e7eb; text-align:center;"),
+        cells(table_df['Actual_Date'], "padding:8px 8px; border:1px solid #e5e7eb; text-align:center;"),
+        cells(table_df['Lead Time'], "padding:8px 8px; border:1px solid #e5e7eb; text-align:center;"),
+    ]
+    if remarks:
+        columns.append(cells(table_df['Remarks'], "padding:8px 10px; border:1px solid #e5e7eb;"))
+    html += rows(columns, row_style=row_bg)
+
+    html += """
+        </tbody>
+    </table>
+    </div>
+    """
+
+    return html
+
+
+def main(sheet):
+    # sheet: this model's entry from models.registry.sheet()
+    REFRESH_INTERVAL = 30
+    remarks = sheet.get("remarks", False)
+
+    try:
+        table_df, version = load_prepared(sheet["url"], prepare, header=sheet["header"], name=sheet["name"], args=(sheet["name"], sheet.get("rules")))
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        st.stop()
+    notice = stale_notice(sheet["name"])
+    if notice:
+        st.warning(notice)
+
+    # Slightly more compact header
+    st.markdown(f"""
+    <div style="text-align:center; padding:16px; background:linear-gradient(135deg, #1d4ed8 0%, #3b82f6 100%); color:white; border-radius:12px; margin-bottom:12px;">
+        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:800;">{sheet['label']} Milestone</h1>
+        <p style="margin:8px 0 0 0; font-size:1rem;">
+            Updated: {datetime.now().strftime('%d-%b-%Y %H:%M:%S')} • refresh every {REFRESH_INTERVAL}s
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown(timeline_html(sheet["timeline"]), unsafe_allow_html=True)
+
+    html = cached_fragment((sheet["name"], version), lambda: render_table(table_df, remarks))
+    st.markdown(html, unsafe_allow_html=True)
+
+    # Sidebar
+    with st.sidebar:
+        st.success(f"🎯 {sheet['label']}")
+        st.download_button(
+            "📥 Download CSV",
+            (table_df if remarks else table_df.drop(columns="Remarks")).to_csv(index=False).encode(),
+            sheet["filename"],
+            "text/csv"
+        )
@@ -1,64 +1,141 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
 from datetime import datetime
 
-def main():
+from common.fragment_cache import cached_fragment
+from common.html_table import cells, column, rows
+from common.pagination import paginate
+from common.schema import resolve
+from common.sheet_loader import load_prepared, stale_notice
+
+
+
+def prepare(df):
+    # Column detection, counts and filter options; cached per data version
+    cols = resolve("mom", df.columns)
+    open_point_col = cols["open_point"]
+    resp_col = cols["resp"]
+    status_col = cols["status"]
+    if not all([open_point_col, resp_col, status_col]):
+        return {"df": df, "cols": cols}
+
+    status = df[status_col].astype(str)
+    counts = {
+        "total": len(df),
+        "open": int(status.str.contains("open", case=False, na=False).sum()),
+        "closed": int(status.str.contains("closed", case=False, na=False).sum()),
+    }
+    resp_options = sorted(df[resp_col].dropna().unique().tolist())
+
+    return {"df": df, "cols": cols, "counts": counts, "resp_options": resp_options}
+
+
+def render_table(page, cols):
+    date_col = cols["date"]
+    open_point_col = cols["open_point"]
+    resp_col = cols["resp"]
+    target_date_col = cols["target_date"]
+    status_col = cols["status"]
+    remarks_col = cols["remarks"]
+
+    # ── MORE COMPACT TABLE ──────────────────────────────────────────────────
+    html = """
+    <div style="overflow-x:auto; margin:25px 0;">
+    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif; font-size:0.92rem;">
+        <thead>
+            <tr>
+                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Date</th>
+                <th style='background:#22c55e; color:white; padding:8px 10px; text-align:left; font-weight:800; width:38%;'>Open Point List</th>
+                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Resp.</th>
+                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Target Date</th>
+                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Status</th>
+                <th style='background:#22c55e; color:white; padding:8px 10px; text-align:left; font-weight:800;'>Remarks</th>
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+    status = column(page, status_col).astype(str).str.strip()
+    status_lower = status.str.lower()
+    status_style = np.select(
+        [status_lower.str.contains("closed", regex=False), status_lower.str.contains("open", regex=False)],
+        ["background:#d1fae5; color:#065f46;", "background:#fee2e2; color:#991b1b;"],
+        "background:#fffbeb; color:#92400e;",
+    )
+
+    html += rows([
+        cells(column(page, date_col), "padding:7px 6px; border:1px solid #e2e8f0; text-align:center;"),
+        cells(column(page, open_point_col), "padding:7px 10px; border:1px solid #e2e8f0;"),
+        cells(column(page, resp_col), "padding:7px 6px; border:1px solid #e2e8f0; text-align:center;"),
+        cells(column(page, target_date_col), "padding:7px 6px; border:1px solid #e2e8f0; text-align:center;"),
+        cells(status, "padding:7px 6px; border:1px solid #e2e8f0; text-align:center; " + status_style + " font-weight:bold;"),
+        cells(column(page, remarks_col), "padding:7px 10px; border:1px solid #e2e8f0;"),
+    ])
+
+    html += """
+        </tbody>
+    </table>
+    </div>
+    """
+
+    return html
+
+
+def main(sheet):
+    # sheet: this model's entry from models.registry.sheet()
     REFRESH_INTERVAL = 30
-    CSV_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vSWMp9BS_dmgqDQfsvaT525XtS0yZk4OcBm16soaIlZa6qgAmeGS4UncOBB5l_K9pX0czG2IrHsohte/pub?gid=1982980723&single=true&output=csv"
 
-    @st.cache_data(ttl=REFRESH_INTERVAL)
-    def load_data():
-        df = pd.read_csv(CSV_URL)
-        df = df.dropna(how='all').reset_index(drop=True)
-        df = df.fillna("—")
-        df = df.loc[:, ~df.columns.duplicated()]
-        return df
+    data, version = load_prepared(sheet["url"], prepare, name=sheet["name"])
+    notice = stale_notice(sheet["name"])
+    if notice:
+        st.warning(notice)
 
-    df = load_data()
+    df = data["df"]
+    cols = data["cols"]
+    date_col = cols["date"]
+    open_point_col = cols["open_point"]
+    resp_col = cols["resp"]
+    target_date_col = cols["target_date"]
+    status_col = cols["status"]
+    remarks_col = cols["remarks"]
 
     # Header (unchanged)
     st.markdown(f"""
     <div style="text-align:center; padding:20px; background:linear-gradient(135deg,#4338ca 0%, #a78bfa 100%); color:white; border-radius:16px; margin-bottom:15px; box-shadow: 0 12px 30px rgba(124,62,237,0.3);">
-        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:1000;"> MERLIN Minutes of Meeting(MOM)</h1>
+        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:1000;"> {sheet['label']} Minutes of Meeting(MOM)</h1>
         <p style="margin:10px 0 0 0; font-size:1.1rem;">
             Updated: {datetime.now().strftime("%d-%b-%Y %I:%M:%S %p")} • Auto-refresh every {REFRESH_INTERVAL}s
         </p>
     </div>
     """, unsafe_allow_html=True)
 
-    # Meeting Info (unchanged)
-    st.markdown("""
-    <div style="background:#f0fdf4; padding:15px; border-radius:16px; margin:10px 0; border-left:6px #22c55e; box-shadow:0 4px 20px rgba(0,0,0,0.08);">
-        <h3 style="text-align:center; color:#0c4a6e; font-size:1.2rem; margin:5px 0;">Meeting Schedule Date: 12-Jan-2026</h3>
-        <div style="display:flex; justify-content:center; gap:100px; margin-top:10px; flex-wrap:wrap;">
-            <div style="text-align:center;">
-                <p style="font-weight:bold; color:#1e40af; margin:0;">Dixon</p>
-                <p style="margin:3px 0 0 0; color:#64748b;">Subrat, Risabh</p>
-            </div>
+    # Meeting Info
+    meeting = sheet.get("meeting")
+    if meeting:
+        attendees = "".join(
+            f"""
             <div style="text-align:center;">
-                <p style="font-weight:bold; color:#1e40af; margin:0;">Moto</p>
-                <p style="margin:3px 0 0 0; color:#64748b;">Kawaljeet, Sachin,Janki,Saubhagya, Saurov,Yang yang24 ,Zheng Zheng3,Zhongyu</p>
-            </div>
+                <p style="font-weight:bold; color:#1e40af; margin:0;">{company}</p>
+                <p style="margin:3px 0 0 0; color:#64748b;">{people}</p>
+            </div>"""
+            for company, people in meeting["attendees"]
+        )
+        st.markdown(f"""
+    <div style="background:#f0fdf4; padding:15px; border-radius:16px; margin:10px 0; border-left:6px #22c55e; box-shadow:0 4px 20px rgba(0,0,0,0.08);">
+        <h3 style="text-align:center; color:#0c4a6e; font-size:1.2rem; margin:5px 0;">Meeting Schedule Date: {meeting["date"]}</h3>
+        <div style="display:flex; justify-content:center; gap:100px; margin-top:10px; flex-wrap:wrap;">{attendees}
         </div>
     </div>
     """, unsafe_allow_html=True)
 
-    # Column detection (unchanged)
-    date_col = next((c for c in df.columns if "date" in c.lower() and "target" not in c.lower()), None)
-    open_point_col = next((c for c in df.columns if "open point" in c.lower() or "open" in c.lower()), None)
-    resp_col = next((c for c in df.columns if "resp" in c.lower()), None)
-    target_date_col = next((c for c in df.columns if "target date" in c.lower() or "target dt" in c.lower()), None)
-    status_col = next((c for c in df.columns if "status" in c.lower()), None)
-    remarks_col = next((c for c in df.columns if "remark" in c.lower() or "remarks" in c.lower()), None)
-
     if not all([open_point_col, resp_col, status_col]):
         st.error("Required MOM columns not found in sheet.")
         st.stop()
 
     # Count Cards (unchanged)
-    total_count = len(df)
-    open_count = len(df[df[status_col].astype(str).str.contains("open", case=False, na=False)])
-    closed_count = len(df[df[status_col].astype(str).str.contains("closed", case=False, na=False)])
+    total_count = data["counts"]["total"]
+    open_count = data["counts"]["open"]
+    closed_count = data["counts"]["closed"]
     c1, c2, c3 = st.columns(3)
     with c1:
         st.markdown(f"""
@@ -89,13 +166,13 @@ def main():
     fcol1, fcol2 = st.columns([2, 2])
     with fcol1:
         if resp_col:
-            resp_options = ["All"] + sorted(df[resp_col].dropna().unique().tolist())
+            resp_options = ["All"] + data["resp_options"]
             chosen_resp = st.selectbox("Responsible Person", resp_options, index=0, key="mom_resp_filter_final")
     with fcol2:
         chosen_status = st.selectbox("Status", ["All", "Closed", "Open"], index=0, key="mom_status_filter_final")
 
     # Apply filters
-    filtered = df.copy()
+    filtered = df
     if resp_col and chosen_resp != "All":
         filtered = filtered[filtered[resp_col] == chosen_resp]
     if chosen_status != "All":
@@ -104,61 +181,22 @@ def main():
     # Table columns
     cols_to_show = [date_col, open_point_col, resp_col, target_date_col, status_col, remarks_col]
     valid_cols = [c for c in cols_to_show if c is not None]
-    table_df = filtered[valid_cols].copy()
-
-    # ── MORE COMPACT TABLE ──────────────────────────────────────────────────
-    html = """
-    <div style="overflow-x:auto; margin:25px 0;">
-    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif; font-size:0.92rem;">
-        <thead>
-            <tr>
-                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Date</th>
-                <th style='background:#22c55e; color:white; padding:8px 10px; text-align:left; font-weight:800; width:38%;'>Open Point List</th>
-                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Resp.</th>
-                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Target Date</th>
-                <th style='background:#22c55e; color:white; padding:8px 6px; text-align:center; font-weight:800;'>Status</th>
-                <th style='background:#22c55e; color:white; padding:8px 10px; text-align:left; font-weight:800;'>Remarks</th>
-            </tr>
-        </thead>
-        <tbody>
-    """
-
-    for _, row in table_df.iterrows():
-        status = str(row.get(status_col, "—")).strip()
-        status_lower = status.lower()
-        if "closed" in status_lower:
-            status_cell = f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center; background:#d1fae5; color:#065f46; font-weight:bold;'>{status}</td>"
-        elif "open" in status_lower:
-            status_cell = f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center; background:#fee2e2; color:#991b1b; font-weight:bold;'>{status}</td>"
-        else:
-            status_cell = f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center; background:#fffbeb; color:#92400e; font-weight:bold;'>{status}</td>"
-
-        html += "<tr>"
-        html += f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center;'>{row.get(date_col, '—')}</td>"
-        html += f"<td style='padding:7px 10px; border:1px solid #e2e8f0;'>{row.get(open_point_col, '—')}</td>"
-        html += f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center;'>{row.get(resp_col, '—')}</td>"
-        html += f"<td style='padding:7px 6px; border:1px solid #e2e8f0; text-align:center;'>{row.get(target_date_col, '—')}</td>"
-        html += status_cell
-        html += f"<td style='padding:7px 10px; border:1px solid #e2e8f0;'>{row.get(remarks_col, '—')}</td>"
-        html += "</tr>"
-
-    html += """
-        </tbody>
-    </table>
-    </div>
-    """
-
+    table_df = filtered[valid_cols]
+
+    # Only the visible page is rendered, once per data version and view
+    shown = paginate(len(table_df), key="mom")
+    html = cached_fragment(
+        (sheet["name"], version, chosen_resp, chosen_status, shown.start, shown.stop),
+        lambda: render_table(table_df.iloc[shown], cols),
+    )
     st.markdown(html, unsafe_allow_html=True)
 
     # Sidebar (unchanged)
     with st.sidebar:
-        st.success("📝 MERLIN MOM")
+        st.success(f"📝 {sheet['label']} MOM")
         st.download_button(
             "📥 Download MOM Data",
             df.to_csv(index=False).encode(),
-            "merlin_mom_data.csv",
+            sheet["filename"],
             "text/csv"
         )
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,133 @@
+import streamlit as st
+import numpy as np
+from datetime import datetime
+
+from common.dates import parse_dates
+from common.fragment_cache import cached_fragment
+from common.html_table import cells, column, rows
+from common.schema import resolve
+from common.sheet_loader import load_prepared, stale_notice
+
+
+
+def prepare(df, source=None):
+    # Column detection and date formatting; cached per data version.
+    # source: the sheet name, so date formats are remembered per sheet
+    cols = resolve("plan", df.columns)
+    wbs_col = cols["wbs"]
+    milestone_col = cols["milestone"]
+    plan_col = cols["plan"]
+    actual_col = cols["actual"]
+    remarks_col = cols["remarks"]
+
+    if not all([wbs_col, milestone_col, plan_col]):
+        return {"df": df, "cols": cols}
+
+    # Format dates
+    df_display = df.copy()
+    if plan_col in df_display.columns:
+        df_display[plan_col] = parse_dates(df_display[plan_col], key=(source, plan_col))
+        df_display[plan_col] = df_display[plan_col].dt.strftime('%d-%b').fillna("—")
+    if actual_col in df_display.columns:
+        df_display[actual_col] = parse_dates(df_display[actual_col], key=(source, actual_col))
+        df_display[actual_col] = df_display[actual_col].dt.strftime('%d-%b').fillna("—")
+
+    cols_to_show = [wbs_col, milestone_col, plan_col, actual_col, remarks_col]
+    valid_cols = [c for c in cols_to_show if c in df_display.columns]
+    table_df = df_display[valid_cols]
+
+    return {"df": df, "cols": cols, "table": table_df}
+
+
+def render_table(table_df, cols):
+    wbs_col = cols["wbs"]
+    milestone_col = cols["milestone"]
+    plan_col = cols["plan"]
+    actual_col = cols["actual"]
+    remarks_col = cols["remarks"]
+
+    html = """
+    <div style="overflow-x:auto; margin:20px 0;">
+    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif; font-size:0.92rem;">
+        <thead>
+            <tr>
+                <th style='background:#7c3aed; color:white; padding:10px 8px; text-align:left; font-weight:700; font-size:1.0rem; width:18%;'>WBS</th>
+                <th style='background:#7c3aed; color:white; padding:10px 10px; text-align:left; font-weight:700; font-size:1.0rem; width:20%;'>Milestone</th>
+                <th style='background:#7c3aed; color:white; padding:10px 8px; text-align:center; font-weight:700; font-size:1.0rem; width:10%;'>Plan Date</th>
+                <th style='background:#7c3aed; color:white; padding:10px 8px; text-align:center; font-weight:700; font-size:1.0rem; width:10%;'>Actual Date</th>
+                <th style='background:#7c3aed; color:white; padding:10px 12px; text-align:left; font-weight:700; font-size:1.0rem; width:35%;'>Remarks</th>
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+    # WBS shown only where it changes from the row above
+    wbs = table_df[wbs_col]
+    display_wbs = wbs.where(wbs.ne(wbs.shift()), "")
+
+    # Light row coloring
+    row_bg = np.where(table_df.index.to_numpy() % 2 == 0, "background:#f9fafb;", "background:#ffffff;")
+
+    html += rows([
+        cells(display_wbs, "padding:8px 8px; border-bottom:1px solid #e5e7eb; font-weight:600;"),
+        cells(table_df[milestone_col], "padding:8px 10px; border-bottom:1px solid #e5e7eb; font-weight:500;"),
+        cells(column(table_df, plan_col), "padding:8px 8px; border-bottom:1px solid #e5e7eb; text-align:center; font-weight:500;"),
+        cells(column(table_df, actual_col), "padding:8px 8px; border-bottom:1px solid #e5e7eb; text-align:center; font-weight:500;"),
+        cells(column(table_df, remarks_col), "padding:8px 12px; border-bottom:1px solid #e5e7eb; font-weight:400; opacity:0.9;"),
+    ], row_style=row_bg)
+
+    html += """
+        </tbody>
+    </table>
+    </div>
+    """
+
+    return html
+
+
+def main(sheet):
+    # sheet: this model's entry from models.registry.sheet()
+    REFRESH_INTERVAL = 30
+
+    data, version = load_prepared(sheet["url"], prepare, name=sheet["name"], args=(sheet["name"],))
+    notice = stale_notice(sheet["name"])
+    if notice:
+        st.warning(notice)
+
+    df = data["df"]
+    cols = data["cols"]
+    wbs_col = cols["wbs"]
+    milestone_col = cols["milestone"]
+    plan_col = cols["plan"]
+    actual_col = cols["actual"]
+    remarks_col = cols["remarks"]
+
+    # Beautiful Header (unchanged)
+    st.markdown(f"""
+    <div style="text-align:center; padding:20px; background:linear-gradient(135deg, #c2410c 0%, #ea580c 100%); color:white; border-radius:16px; margin-bottom:20px; box-shadow: 0 12px 30px rgba(194,65,12,0.3);">
+        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:800;"> {sheet['label']} Plan</h1>
+        <p style="margin:10px 0 0 0; font-size:1.1rem;">
+            Updated: {datetime.now().strftime("%d-%b-%Y %I:%M:%S %p")} • Auto-refresh every {REFRESH_INTERVAL}s
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if not all([wbs_col, milestone_col, plan_col]):
+        st.error("Required columns (WBS, Milestone, Plan Date) not found in sheet.")
+        st.stop()
+
+    # ── COMPACT TABLE with adjusted column widths ────────────────────────────
+    table_df = data["table"]
+
+    html = cached_fragment((sheet["name"], version), lambda: render_table(table_df, cols))
+    st.markdown(html, unsafe_allow_html=True)
+
+    # Sidebar (unchanged)
+    with st.sidebar:
+        st.success(f"🚀 {sheet['label']} Project Plan")
+        st.download_button(
+            "📥 Download Data",
+            df.to_csv(index=False).encode(),
+            sheet["filename"],
+            "text/csv"
+        )
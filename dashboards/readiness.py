@@ -0,0 +1,278 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from common.dates import parse_dates
+from common.fragment_cache import cached_fragment
+from common.filter_index import build_index, select_rows
+from common.html_table import cells, rows
+from common.pagination import paginate
+from common.schema import resolve
+from common.sheet_loader import load_prepared, stale_notice
+from common.status_rules import READINESS_RULES, RULE_SETS
+from common.status_summary import count, summarize
+from common.timeline import timeline_html
+
+STATUS_RULES = READINESS_RULES
+
+
+def prepare(df, source=None, keep_dates=False, rules=None):
+    # Everything that depends only on the sheet; cached per data version.
+    # source: the sheet name, so date formats are remembered per sheet;
+    # rules: the config's RULE_SETS name, if it overrides STATUS_RULES
+    cols = resolve("readiness", df.columns)
+
+    # ── NEW: Fill down Process Category ────────────────────────────────
+    category_col = cols["category"]
+    if category_col:
+        # Replace dash with NaN so ffill works correctly
+        df[category_col] = df[category_col].replace("—", pd.NA)
+        # Forward fill → repeat last valid category
+        df[category_col] = df[category_col].ffill()
+        # Optional: fill remaining leading NaN if any (very rare)
+        df[category_col] = df[category_col].fillna("No Category")
+
+    # ───────────────────────────────────────────────────────────────────
+
+    sub_col      = cols["sub"]
+    owner_col    = cols["owner"]
+    target_col   = cols["target"]
+    actual_col   = cols["actual"]
+    status_col   = cols["status"]
+
+    if not all([category_col, sub_col, owner_col, target_col, status_col]):
+        return {"df": df, "cols": cols}
+
+    # Date parsing (keep_dates: shown exactly as in the sheet; the rules parse them)
+    if not keep_dates:
+        if target_col:
+            df[target_col] = parse_dates(df[target_col], key=(source, target_col))
+        if actual_col:
+            df[actual_col] = parse_dates(df[actual_col], key=(source, actual_col))
+
+    status_rules = RULE_SETS[rules] if rules else STATUS_RULES
+    df["Final Status"] = status_rules(df, cols, source=source)
+
+    # Display format; statuses above already used the parsed dates
+    if not keep_dates:
+        if target_col:
+            df[target_col] = df[target_col].dt.strftime('%d-%b').fillna("—")
+        if actual_col:
+            df[actual_col] = df[actual_col].dt.strftime('%d-%b').fillna("—")
+
+    # Filter options: owners, and the categories each owner has
+    owners = sorted(df[owner_col].dropna().unique().tolist())
+    categories = {"All": sorted(df[category_col].dropna().unique().tolist())}
+    for owner, group in df.groupby(owner_col, sort=False):
+        categories[owner] = sorted(group[category_col].dropna().unique().tolist())
+
+    # Row positions per owner / category / status: a filter click is an intersection
+    index = build_index(df, [owner_col, category_col, "Final Status"])
+
+    # Status counts: totals, per category (with % closed) and per owner
+    summary = summarize(df, "Final Status", category_col, owner_col)
+
+    return {
+        "df": df, "cols": cols, "owners": owners, "categories": categories,
+        "index": index, "summary": summary,
+    }
+
+
+def render_table(page, cols, keep_dates=False):
+    category_col = cols["category"]
+    sub_col      = cols["sub"]
+    owner_col    = cols["owner"]
+    target_col   = cols["target"]
+    actual_col   = cols["actual"]
+    status_col   = cols["status"]
+    remark_col   = cols["remark"]
+
+    # ── COMPACT HTML TABLE ───────────────────────────────────────────────
+    html = """
+    <div style="overflow-x:auto; margin:12px 0;">
+    <table style="width:100%; border-collapse:collapse; font-family:Arial, sans-serif; font-size:0.88rem; line-height:1.25;">
+        <thead>
+            <tr style="background:#1e40af; color:white;">
+    """
+
+    # Dates as typed in the sheet run longer than '%d-%b'
+    date_width = "7%" if keep_dates else "5%"
+    column_widths = {
+        category_col: "10%",
+        sub_col:      "25%",
+        owner_col:    "13%",
+        target_col:   date_width,
+        actual_col:   date_width,
+        status_col:   "5%",
+        remark_col:   "30%" if keep_dates else "34%",
+        "Final Status": "13%" if keep_dates else "14%"
+    }
+
+    for col in page.columns:
+        width = column_widths.get(col, "12%")
+        html += f"<th style='padding:6px 6px; text-align:left; font-weight:700; width:{width}; font-size:0.9rem;'>{col}</th>"
+
+    html += """
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+    row_colors = {
+        "Delayed": "background:#fef2f2; color:#991b1b;",
+        "Opened": "background:#fffbeb; color:#92400e;",
+        "Closed": "background:#f0fdf4; color:#166534;",
+    }
+    status_colors = {
+        "Delayed": "background:#ef4444; color:white; font-weight:bold;",
+        "Opened": "background:#fbbf24; color:white; font-weight:bold;",
+        "Closed": "background:#22c55e; color:white; font-weight:bold;",
+    }
+    cell_style = "padding:6px 6px; border:1px solid #e5e7eb; vertical-align:top; "
+
+    final = page["Final Status"]
+
+    columns = []
+    for col in page.columns:
+        style = cell_style + final.map(status_colors).fillna("") if col == "Final Status" else cell_style
+        columns.append(cells(page[col], style, newlines=True))
+    html += rows(columns, row_style=final.map(row_colors).fillna("background:; color:;"))
+
+    html += """
+        </tbody>
+    </table>
+    </div>
+    """
+
+    return html
+
+
+def main(sheet):
+    # sheet: this model's entry from models.registry.sheet()
+    REFRESH_INTERVAL = 30
+    keep_dates = sheet.get("keep_dates", False)
+
+    data, version = load_prepared(sheet["url"], prepare, name=sheet["name"], args=(sheet["name"], keep_dates, sheet.get("rules")))
+    notice = stale_notice(sheet["name"])
+    if notice:
+        st.warning(notice)
+
+    df = data["df"]
+    cols = data["cols"]
+    category_col = cols["category"]
+    sub_col      = cols["sub"]
+    owner_col    = cols["owner"]
+    target_col   = cols["target"]
+    actual_col   = cols["actual"]
+    status_col   = cols["status"]
+    remark_col   = cols["remark"]
+
+    # Header
+    st.markdown(f"""
+    <div style="text-align:center; padding:16px; background:linear-gradient(135deg, #1d4ed8 0%, #3b82f6 100%); color:white; border-radius:12px; margin-bottom:12px;">
+        <h1 style="margin:0; font-size:2.4rem; color:white; font-weight:800;">{sheet['label']} Readiness</h1>
+        <p style="margin:8px 0 0 0; font-size:1rem;">
+            Updated: {datetime.now().strftime('%d-%b-%Y %H:%M:%S')} • refresh every {REFRESH_INTERVAL}s
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown(timeline_html(sheet["timeline"]), unsafe_allow_html=True)
+
+    essential = [category_col, sub_col, owner_col, target_col, status_col]
+    if not all(essential):
+        st.error("Essential columns not found in sheet.")
+        st.stop()
+
+    # Metrics
+    summary = data["summary"]
+    delayed = summary["totals"]["Delayed"]
+    opened  = summary["totals"]["Opened"]
+    closed  = summary["totals"]["Closed"]
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.markdown(f"""
+        <div style='background:#ef4444;color:white;padding:12px;border-radius:10px;text-align:center;'>
+            <p style='margin:0;font-weight:800;font-size:1.3rem;'>Delayed</p>
+            <h2 style='margin:4px 0 0 0;color:white;font-size:1.8rem;'>{delayed}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    with c2:
+        st.markdown(f"""
+        <div style='background:#fbbf24;color:white;padding:12px;border-radius:10px;text-align:center;'>
+            <p style='margin:0;font-weight:800;font-size:1.3rem;'>Opened</p>
+            <h2 style='margin:4px 0 0 0;color:white;font-size:1.8rem;'>{opened}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    with c3:
+        st.markdown(f"""
+        <div style='background:#22c55e;color:white;padding:12px;border-radius:10px;text-align:center;'>
+            <p style='margin:0;font-weight:800;font-size:1.3rem;'>Closed</p>
+            <h2 style='margin:4px 0 0 0;color:white;font-size:1.8rem;'>{closed}</h2>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Progress per Process Category
+    with st.expander("📊 Progress by Process Category"):
+        for category, row in summary["by_category"].iterrows():
+            st.progress(
+                int(row["% Closed"]),
+                text=f"{category}: {row['Closed']}/{row['Total']} closed ({row['% Closed']}%) • {row['Delayed']} delayed",
+            )
+
+    st.markdown("---")
+
+    # Filters (unchanged)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        owners = ["All"] + data["owners"]
+        chosen_owner = st.selectbox("Owner", owners, key="owner_av")
+
+    with col2:
+        categories = ["All"] + data["categories"][chosen_owner]
+        chosen_cat = st.selectbox("Process Category", categories, key="cat_av")
+
+    with col3:
+        view = st.selectbox("View",
+                            ["All Items", "Only Delayed", "Only Opened", "Only Closed"],
+                            key="view_av")
+
+    view_status = {"Only Delayed": "Delayed", "Only Opened": "Opened", "Only Closed": "Closed"}
+    filtered = select_rows(df, data["index"], {
+        owner_col: chosen_owner,
+        category_col: chosen_cat,
+        "Final Status": view_status.get(view, "All"),
+    })
+
+    urgent = count(summary, {owner_col: chosen_owner, category_col: chosen_cat, "Final Status": "Delayed"})
+    if view_status.get(view, "All") not in ("All", "Delayed"):
+        urgent = 0  # the view hides delayed items
+    if urgent:
+        st.error(f"🚨 {urgent} items DELAYED")
+    else:
+        st.success("✅ All items are Opened or Closed")
+
+    # Prepare table
+    table_df = filtered
+
+    possible_cols = [category_col, sub_col, owner_col, target_col, actual_col, status_col, remark_col, "Final Status"]
+    cols_to_show = [c for c in possible_cols if c is not None and c in table_df.columns]
+    table_df = table_df[cols_to_show]
+
+    # Only the visible page is rendered, once per data version and view
+    shown = paginate(len(table_df), key="readiness")
+    html = cached_fragment(
+        (sheet["name"], version, chosen_owner, chosen_cat, view, shown.start, shown.stop),
+        lambda: render_table(table_df.iloc[shown], cols, keep_dates),
+    )
+    st.markdown(html, unsafe_allow_html=True)
+
+    with st.sidebar:
+        st.success(f"🎯 {sheet['label']}")
+        st.download_button(
+            "📥 Download Current View",
+            table_df.to_csv(index=False).encode(),
+            sheet["filename"],
+            "text/csv"
+        )
@@ -0,0 +1,147 @@
+"""Every model the dashboard knows about, as configuration.
+
+The dashboard code lives once per dashboard type in ``dashboards/``; what
+differs between models is data: the published sheet behind each
+dashboard, the display label and the programme timeline. Adding a model
+is an entry in ``MODELS``:
+
+    "NEW_MODEL": {
+        "label": "NEW MODEL",                       # titles, sidebar
+        "timeline": [("PVT", "01 JAN"), ...],       # first entry highlighted
+        "dashboards": {
+            "readiness": {"url": "https://...output=csv"},
+            "milestone": {"url": "...", "timeline": [...]},   # per-dashboard override
+        },
+    }
+
+Dashboard entries take a few optional settings on top of ``url``:
+
+* readiness: ``keep_dates`` shows Target/Actual dates exactly as typed
+  in the sheet instead of re-formatting them.
+* milestone: ``remarks`` shows the fifth (Remarks) column.
+* readiness, milestone: ``rules`` names the status rule set, one of
+  ``common.status_rules.RULE_SETS``; without it the dashboard's standard
+  set applies.
+* mom: ``meeting`` is the schedule date and attendees shown above the table.
+"""
+
+DASHBOARDS = ["readiness", "milestone", "plan", "kpi", "mom"]
+
+# How each dashboard type reads its sheet; milestone sheets come in as a
+# raw grid that the engine shapes itself
+HEADERS = {"milestone": None}
+
+# CSV download names: "<label>_<suffix>.csv", e.g. merlin_kpi_data.csv
+DOWNLOAD_SUFFIXES = {"kpi": "kpi_data", "plan": "project_plan", "mom": "mom_data"}
+
+MODELS = {
+    "AVENGER": {
+        "label": "AVENGER",
+        "timeline": [("PVT", "23 DEC"), ("OK2P", "15 JAN"), ("OK2R", "27 JAN"), ("OK2S", "05 FEB")],
+        "dashboards": {
+            "readiness": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSz6_P0LpHQadhO2FtHbHcAz5t3wl-prjVx_4erMZkwYYlVHwW0sB6uDT_NkmGSxAJgkoglXebCzD1f/pub?gid=1477446268&single=true&output=csv",
+            },
+        },
+    },
+    "DALLAS_NA": {
+        "label": "DALLAS",
+        "timeline": [("PVT", "15 DEC"), ("OK2P", "02 FEB"), ("OK2R", "13 FEB"), ("OK2S", "23 FEB")],
+        "dashboards": {
+            "readiness": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vQBqDIx_ZBSYN7RaWxCIjHMZeFBkMhQaKcmc8mvq9KrE-Z1EFeaIsC1B4Fmw_wE_1NbzsConI04b6o0/pub?gid=777730961&single=true&output=csv",
+            },
+            "milestone": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSe4nuvqUK1UQdv7o0aC8sunzc3sIIA6Ml29g9FV2-4CBO254JwHhA7HXXEDzefSqkgDxXNuc9bXp4-/pub?gid=287111587&single=true&output=csv",
+                "timeline": [("PVT", "15 DEC"), ("OK2P", "02 FEB"), ("OK2R", "13 FEB"), ("OK2S", "06 MAR")],
+                "rules": "milestone_on_time",
+            },
+        },
+    },
+    "MERLIN": {
+        "label": "MERLIN",
+        "timeline": [("PVT", "16 JAN"), ("OK2P", "23 FEB"), ("OK2R", "16 MAR")],
+        "dashboards": {
+            "readiness": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vQBqDIx_ZBSYN7RaWxCIjHMZeFBkMhQaKcmc8mvq9KrE-Z1EFeaIsC1B4Fmw_wE_1NbzsConI04b6o0/pub?gid=398221268&single=true&output=csv",
+                "keep_dates": True,
+            },
+            "milestone": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSe4nuvqUK1UQdv7o0aC8sunzc3sIIA6Ml29g9FV2-4CBO254JwHhA7HXXEDzefSqkgDxXNuc9bXp4-/pub?gid=1944217723&single=true&output=csv",
+                "timeline": [("PVT", "16 JAN"), ("OK2P", "23 FEB"), ("OK2R", "16 APR"), ("OK2S", "06 MAR")],
+                "remarks": True,
+            },
+            "plan": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSUKAu7fJg3Oi9Q8_ffen20iCKteQCKLAXCrAVf369XD7zWGF_E3WNko47pUhWLz865B4NHWMFYKEaS/pub?gid=1031879361&single=true&output=csv",
+            },
+            "kpi": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vTsS6PyxZ7Q07fxpaCmc-0mMowukVYiFA5EyDUP6BmFhXniA53bM30drIZnhEjLSPVHzuaqS4jjlLwb/pub?gid=1065751321&single=true&output=csv",
+            },
+            "mom": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSWMp9BS_dmgqDQfsvaT525XtS0yZk4OcBm16soaIlZa6qgAmeGS4UncOBB5l_K9pX0czG2IrHsohte/pub?gid=1982980723&single=true&output=csv",
+                "meeting": {
+                    "date": "12-Jan-2026",
+                    "attendees": [
+                        ("Dixon", "Subrat, Risabh"),
+                        ("Moto", "Kawaljeet, Sachin,Janki,Saubhagya, Saurov,Yang yang24 ,Zheng Zheng3,Zhongyu"),
+                    ],
+                },
+            },
+        },
+    },
+    "UTAH_NA": {
+        "label": "UTAH NA",
+        "timeline": [("OK2P", "09 NOV"), ("OK2R", "29 OCT"), ("OK2S", "19 NOV")],
+        "dashboards": {
+            "readiness": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vQBqDIx_ZBSYN7RaWxCIjHMZeFBkMhQaKcmc8mvq9KrE-Z1EFeaIsC1B4Fmw_wE_1NbzsConI04b6o0/pub?gid=1841630466&single=true&output=csv",
+            },
+            "milestone": {
+                "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSe4nuvqUK1UQdv7o0aC8sunzc3sIIA6Ml29g9FV2-4CBO254JwHhA7HXXEDzefSqkgDxXNuc9bXp4-/pub?gid=942132829&single=true&output=csv",
+                "timeline": [("PVT", "01 SEP"), ("OK2P", "09 OCT"), ("OK2R", "29 OCT"), ("OK2S", "19 NOV")],
+                "rules": "milestone_on_time",
+            },
+        },
+    },
+}
+
+
+# Derived once at import; app.py reads these on every rerun
+MODEL_NAMES = sorted(MODELS)
+_MODEL_DASHBOARDS = {
+    model: [d for d in DASHBOARDS if d in config["dashboards"]]
+    for model, config in MODELS.items()
+}
+
+
+def model_dashboards(model):
+    """The dashboard types ``model`` has, in navigation order."""
+    return _MODEL_DASHBOARDS[model]
+
+
+def sheet(model, dashboard):
+    """Everything a dashboard engine needs to show ``model``'s sheet.
+
+    ``name`` (``"<MODEL>/<dashboard>"``) identifies the sheet to the loader,
+    its disk snapshot and the fragment cache.
+    """
+    config = MODELS[model]
+    entry = config["dashboards"][dashboard]
+    return {
+        "model": model,
+        "dashboard": dashboard,
+        "name": f"{model}/{dashboard}",
+        "label": config["label"],
+        "timeline": config.get("timeline", []),
+        "filename": f"{config['label'].lower().replace(' ', '_')}_{DOWNLOAD_SUFFIXES.get(dashboard, dashboard)}.csv",
+        "header": HEADERS.get(dashboard, "infer"),
+        **entry,
+    }
+
+
+def model_sheets(model):
+    """Every sheet ``model``'s dashboards read, as (url, header, snapshot name)."""
+    return [
+        (entry["url"], entry["header"], entry["name"])
+        for entry in (sheet(model, d) for d in model_dashboards(model))
+    ]
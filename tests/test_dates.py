@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from common import dates
+from common.dates import parse_dates
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(dates, "_inferred", {})
+
+
+def test_infers_the_format_and_blanks_become_nat():
+    result = parse_dates(pd.Series(["12-Jan-26", "—", "", "03-Feb-26"], index=[5, 6, 7, 8]))
+    assert result.tolist()[0] == pd.Timestamp("2026-01-12")
+    assert result.tolist()[3] == pd.Timestamp("2026-02-03")
+    assert result.iloc[1:3].isna().all()
+    assert result.index.tolist() == [5, 6, 7, 8]
+
+
+def test_yearless_dates_take_the_given_year():
+    assert parse_dates(pd.Series(["29-Feb"]), year=2028).tolist() == [pd.Timestamp("2028-02-29")]
+
+
+def test_mixed_column_falls_back_to_runner_up_formats():
+    result = parse_dates(pd.Series(["12-Jan-26", "13-Jan-26", "2026-01-14", "soon"]))
+    assert result.tolist()[:3] == [pd.Timestamp(f"2026-01-{d}") for d in (12, 13, 14)]
+    assert pd.isna(result.iloc[3])
+
+
+def test_pinned_format():
+    assert parse_dates(pd.Series(["01/02/2026"]), fmt="%d/%m/%Y").tolist() == [pd.Timestamp("2026-02-01")]
+
+
+def test_dayfirst_breaks_ties():
+    values = pd.Series(["01/02/2026"])
+    assert parse_dates(values).tolist() == [pd.Timestamp("2026-01-02")]
+    assert parse_dates(values, dayfirst=True).tolist() == [pd.Timestamp("2026-02-01")]
+
+
+def test_remembered_format_is_kept_per_key():
+    us = pd.Series(["12/31/2026", "01/02/2026"])
+    eu = pd.Series(["31/12/2026", "01/02/2026"])
+    parse_dates(us, key=("US sheet", "Target Date"))
+    parse_dates(eu, key=("EU sheet", "Target Date"))
+    assert dates._inferred == {("US sheet", "Target Date"): "%m/%d/%Y", ("EU sheet", "Target Date"): "%d/%m/%Y"}
+
+    # An ambiguous version of each sheet reads the way that sheet did before
+    ambiguous = pd.Series(["01/02/2026"])
+    assert parse_dates(ambiguous, key=("US sheet", "Target Date")).tolist() == [pd.Timestamp("2026-01-02")]
+    assert parse_dates(ambiguous, key=("EU sheet", "Target Date")).tolist() == [pd.Timestamp("2026-02-01")]
+
+
+def test_nothing_is_cached_without_a_key():
+    parse_dates(pd.Series(["12/31/2026"], name="Target Date"))
+    assert dates._inferred == {}
+
+
+def test_datetime_input_is_returned_as_is():
+    values = pd.Series(pd.to_datetime(["2026-01-01"]))
+    assert parse_dates(values) is values
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from common.html_table import cells, column, escape, rows
+
+
+def test_escape():
+    values = pd.Series(["<b>a & b</b>", "line 1\nline 2", np.nan, 3])
+    assert escape(values).tolist() == ["&lt;b&gt;a &amp; b&lt;/b&gt;", "line 1\nline 2", "nan", "3"]
+    assert escape(values, newlines=True)[1] == "line 1<br>line 2"
+
+
+def test_cells_with_one_style_or_one_per_row():
+    values = pd.Series(["x", "y"], index=[7, 3])
+    assert cells(values, "a:1") == ["<td style='a:1'>x</td>", "<td style='a:1'>y</td>"]
+    assert cells(values, pd.Series(["a:1", "b:2"], index=[7, 3])) == [
+        "<td style='a:1'>x</td>", "<td style='b:2'>y</td>",
+    ]
+
+
+def test_rows():
+    left = cells(pd.Series(["a", "b"]), "s")
+    right = cells(pd.Series(["c", "d"]), "s")
+    assert rows([left, right]) == (
+        "<tr><td style='s'>a</td><td style='s'>c</td></tr>"
+        "<tr><td style='s'>b</td><td style='s'>d</td></tr>"
+    )
+    assert rows([left], row_style=["r1", "r2"]).startswith("<tr style='r1'><td style='s'>a</td></tr><tr style='r2'>")
+    assert rows([]) == ""
+
+
+def test_column_falls_back_to_the_default():
+    df = pd.DataFrame({"a": [1, 2]})
+    assert column(df, "a").tolist() == [1, 2]
+    assert column(df, "missing").tolist() == ["—", "—"]
+    assert column(df, None, default="").tolist() == ["", ""]
@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+
+from common import issue_store
+
+COLUMNS = ["Date", "Product", "Evening Status"]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(issue_store, "DB_PATH", str(tmp_path / "issues.sqlite3"))
+    monkeypatch.setattr(issue_store, "_local", threading.local())
+    issue_store.replace(COLUMNS, [["2026-01-01", "P0", ""], ["2026-01-02", "P1", ""], ["2026-01-03", "P2", ""]])
+    return issue_store
+
+
+def ids(store):
+    return dict(zip(store.load()["Product"], store.load().index))
+
+
+def test_apply_queues_changes_in_order(store):
+    p0, p1 = ids(store)["P0"], ids(store)["P1"]
+    done = store.apply({p0: {"Evening Status": "done"}}, [p1], [{"Date": "2026-01-04", "Product": "P3", "Evening Status": ""}])
+    assert done == {"updated": 1, "deleted": 1, "added": 1}
+    assert [(op, cells) for _, op, _, cells, _ in store.pending()][:2] == [
+        ("update", {"Evening Status": "done"}),
+        ("delete", {"Date": "2026-01-02", "Product": "P1", "Evening Status": ""}),
+    ]
+    assert store.load()["Product"].tolist() == ["P0", "P2", "P3"]   # the tombstone is hidden
+    assert store.status()["pending"] == 3
+
+
+def test_changes_to_rows_deleted_meanwhile_are_dropped(store):
+    p1 = ids(store)["P1"]
+    store.apply({}, [p1], [])
+    assert store.apply({p1: {"Evening Status": "late"}}, [p1], []) == {"updated": 0, "deleted": 0, "added": 0}
+
+
+def test_acknowledge(store):
+    p0, p1, p2 = ids(store).values()
+    store.apply({}, [p1, p2], [{"Date": "", "Product": "P3", "Evening Status": ""}])
+    (s1, _, _, _, _), (s2, _, _, _, _), (s3, _, p3, _, _) = store.pending()
+    assert store.sheet_rows([p0, p1, p2, p3]) == {p0: 2, p1: 3, p2: 4}   # P3 is not in the worksheet yet
+
+    store.acknowledge([s1, s3], appended=[p3], deleted=[p1])
+    store.acknowledge([s2], restored=[p2])
+    assert store.pending() == []
+    assert store.load()["Product"].tolist() == ["P0", "P2", "P3"]
+    assert store.sheet_rows([p0, p2, p3]) == {p0: 2, p2: 3, p3: 4}
+
+
+def test_sheet_cells_leave_out_queued_updates(store):
+    p0 = ids(store)["P0"]
+    store.apply({p0: {"Evening Status": "done"}}, [], [])
+    assert store.sheet_cells([p0]) == {p0: {"Date": "2026-01-01", "Product": "P0"}}
+
+
+def test_rejected_changes_are_set_aside(store):
+    p0, p1 = ids(store)["P0"], ids(store)["P1"]
+    store.apply({p0: {"Evening Status": "bad"}}, [p1], [])
+    update, delete = store.pending()
+    for _ in range(2):
+        store.fail(update[0], ValueError("invalid value"), rejected=True)
+        store.fail(delete[0], ValueError("refused"), rejected=True)
+    store.fail(update[0], ConnectionError("down"))   # transient: does not count
+
+    assert store.set_aside(3) == 0
+    store.fail(delete[0], ValueError("refused"), rejected=True)
+    assert store.set_aside(3) == 1
+    assert [seq for seq, _, _, _, _ in store.pending()] == [update[0]]
+    assert "P1" in store.load()["Product"].tolist()   # its delete was dropped: the row is live again
+    assert store.status()["dead"] == 1
+    assert store.dead_letters()[["Change", "Error"]].values.tolist() == [["delete", "refused"]]
+
+    store.clear_dead_letters()
+    assert store.status()["dead"] == 0
+
+
+def test_setting_an_append_aside_takes_its_row_and_later_changes(store):
+    store.apply({}, [], [{"Date": "2026-01-04", "Product": "P3", "Evening Status": ""}])
+    (seq, _, p3, _, _), = store.pending()
+    store.apply({p3: {"Evening Status": "late"}}, [p3], [])
+    store.reject([seq], "rejected")
+
+    assert store.pending() == []
+    assert "P3" not in store.load()["Product"].tolist()
+    assert sorted(store.dead_letters()["Change"]) == ["append", "delete", "update"]
+
+
+def test_replace_waits_for_the_outbox(store):
+    p0 = ids(store)["P0"]
+    store.apply({p0: {"Evening Status": "done"}}, [], [])
+    assert store.replace(COLUMNS, [["2026-01-01", "P0", "other"]]) is False
+    assert len(store.load()) == 3
+
+
+def test_replace_keeps_ids_when_rows_move(store):
+    before = ids(store)
+    rows = [["2026-01-09", "NEW", ""], ["2026-01-01", "P0", ""], ["2026-01-02", "P1", "edited"], ["2026-01-03", "P2", ""]]
+    assert store.replace(COLUMNS, rows) is True
+    after = ids(store)
+    assert store.load()["Evening Status"].tolist() == ["", "", "edited", ""]
+    assert all(after[name] == before[name] for name in before)
+    assert store.sheet_rows(after.values()) == {after["NEW"]: 2, after["P0"]: 3, after["P1"]: 4, after["P2"]: 5}
+
+    assert store.replace(COLUMNS, rows[:1] + rows[2:]) is True
+    assert ids(store) == {name: after[name] for name in ("NEW", "P1", "P2")}
+
+
+def test_archive(store):
+    store.apply({ids(store)["P0"]: {"Date": "2025-01-01"}}, [], [])
+    assert store.archive_closed("Date", "2025-06-01") == 0   # a change is still queued for it
+    store.acknowledge([seq for seq, _, _, _, _ in store.pending()])
+
+    assert store.archive_closed("Date", "2025-06-01") == 1
+    assert store.load()["Product"].tolist() == ["P1", "P2"]
+    (seq, op, p0, _, _), = store.pending()
+    assert op == "archive" and store.archive_count() == 1
+    assert store.replace_archive(COLUMNS, []) is False   # the copy has not reached the archive worksheet
+
+    assert [issue_id for issue_id, _ in store.unsent_archive([p0])] == [p0]
+    store.archive_sent([p0])
+    store.acknowledge([seq], deleted=[p0])
+    assert store.load_archive(0, 10)["Product"].tolist() == ["P0"]
+    assert store.replace_archive(COLUMNS, [["2024-01-01", "OLD", "done"]]) is True
+    assert store.load_archive(0, 10)["Product"].tolist() == ["OLD"]
@@ -0,0 +1,96 @@
+import re
+import threading
+
+import pytest
+
+from common import issue_store, issues_tracker
+
+HEADER = ["Date", "Product", "Issue Description"]
+
+
+class FakeWorksheet:
+    """The few worksheet calls a push makes, over a list of rows."""
+
+    def __init__(self, rows, reject_appends=False):
+        self.rows = [list(HEADER)] + [list(row) for row in rows]
+        self.reject_appends = reject_appends
+
+    def _rows(self, a1):
+        first, last = (int(n) for n in re.findall(r"\d+", a1))
+        return [list(row) for row in self.rows[first - 1:last]]
+
+    def batch_get(self, ranges):
+        return [self._rows(a1) for a1 in ranges]
+
+    def get_values(self, a1=None):
+        return self._rows(a1) if a1 else [list(row) for row in self.rows]
+
+    def row_values(self, n):
+        return list(self.rows[n - 1]) if n <= len(self.rows) else []
+
+    def delete_rows(self, first, last):
+        del self.rows[first - 1:last]
+
+    def append_rows(self, rows):
+        if self.reject_appends:
+            raise ValueError("invalid value")
+        self.rows.extend(list(row) for row in rows)
+
+
+@pytest.fixture
+def sheet(tmp_path, monkeypatch):
+    rows = [["2026-01-01", "P0", "a"], ["2026-01-02", "P1", "b"], ["2026-01-03", "P2", "c"]]
+    monkeypatch.setattr(issue_store, "DB_PATH", str(tmp_path / "issues.sqlite3"))
+    monkeypatch.setattr(issue_store, "_local", threading.local())
+    issue_store.replace(HEADER, rows)
+    ws = FakeWorksheet(rows)
+    monkeypatch.setattr(issues_tracker, "get_sheet", lambda reconnect=False: ws)
+    issues_tracker._reset_sync()
+    return ws
+
+
+def push_until_empty(attempts=20):
+    # Each rejected push raises; the sync loop would back off and go again
+    def run():
+        for _ in range(attempts):
+            try:
+                issues_tracker._push()
+                return
+            except ValueError:
+                pass
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(10)
+    assert not worker.is_alive(), "_push did not finish"
+
+
+def ids():
+    df = issue_store.load()
+    return dict(zip(df["Product"], df.index))
+
+
+def test_deletes_remove_their_rows(sheet):
+    issue_store.apply({}, [ids()["P1"]], [])
+    push_until_empty()
+    assert issue_store.pending() == []
+    assert [row[1] for row in sheet.rows[1:]] == ["P0", "P2"]
+
+
+def test_a_delete_keeps_a_row_that_changed_in_the_sheet(sheet):
+    issue_store.apply({}, [ids()["P1"]], [])
+    sheet.rows[2][2] = "edited in the sheet"
+    push_until_empty()
+    assert issue_store.pending() == []
+    assert [row[1] for row in sheet.rows[1:]] == ["P0", "P1", "P2"]
+    assert "P1" in ids()
+
+
+def test_changes_to_a_rejected_append_do_not_hang_the_push(sheet):
+    sheet.reject_appends = True
+    issue_store.apply({}, [], [{"Date": "2026-01-04", "Product": "P3", "Issue Description": "d"}])
+    issue_store.apply({}, [ids()["P3"]], [])
+    push_until_empty()
+    assert issue_store.pending() == []
+    assert sorted(issue_store.dead_letters()["Change"]) == ["append", "delete"]
+    assert len(sheet.rows) == 4 and "P3" not in ids()
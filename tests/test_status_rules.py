@@ -0,0 +1,49 @@
+import pandas as pd
+
+from common.status_rules import (
+    MILESTONE_RULES, ON_TIME_MILESTONE_RULES, READINESS_RULES, RULE_SETS, compile_rules, text_in,
+)
+
+TODAY = pd.Timestamp("2026-03-15")
+COLS = {"status": "Status", "target": "Target Date"}
+
+
+def test_readiness_status_text_wins_over_dates():
+    df = pd.DataFrame({
+        "Status": [" Closed ", "ongoing", "", "", "—"],
+        "Target Date": ["01-Jan-26", "01-Jan-26", "01-Jan-26", "31-Dec-26", ""],
+    })
+    assert READINESS_RULES(df, COLS, today=TODAY).tolist() == ["Closed", "Opened", "Delayed", "Opened", "Opened"]
+
+
+def test_readiness_unparseable_target_is_never_delayed():
+    df = pd.DataFrame({"Status": [""], "Target Date": ["next week"]})
+    assert READINESS_RULES(df, COLS, today=TODAY).tolist() == ["Opened"]
+
+
+def test_milestone_rules():
+    df = pd.DataFrame({
+        "Plan_Date": pd.to_datetime(["2026-03-10", "2026-03-10", "2026-03-10", "2026-04-01"]),
+        "Actual_Date": pd.to_datetime(["2026-03-09", "2026-03-12", None, None]),
+    })
+    assert MILESTONE_RULES(df, today=TODAY).tolist() == ["Done", "Delayed", "Overdue", "Pending"]
+    assert ON_TIME_MILESTONE_RULES(df, today=TODAY).tolist() == [
+        "Completed On Time", "Delayed", "Overdue (No Actual)", "Pending",
+    ]
+
+
+def test_first_matching_rule_wins_and_default_fills_the_rest():
+    status = compile_rules([("A", text_in("x", ["a"])), ("B", text_in("x", ["a", "b"]))], default="Z")
+    df = pd.DataFrame({"x": ["a", "b", "c"]}, index=[10, 20, 30])
+    result = status(df)
+    assert result.tolist() == ["A", "B", "Z"]
+    assert result.index.tolist() == [10, 20, 30]
+
+
+def test_empty_frame_gets_the_default():
+    assert READINESS_RULES(pd.DataFrame({"Status": [], "Target Date": []}), COLS).tolist() == []
+
+
+def test_rule_sets_by_name():
+    assert RULE_SETS["readiness"] is READINESS_RULES
+    assert RULE_SETS["milestone_on_time"] is ON_TIME_MILESTONE_RULES